@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+"""
+eliminate_batch.py - Batch Bayesian update engine for elimination sessions
+
+Applies a whole checkpoint's worth of evidence to every hypothesis in one
+pass. The hypothesis x evidence bearings are flattened into factor columns
+and applied in order, so the results are bit-identical to the scalar rule
+from the `bayesian:` section of .elimination/config.yaml:
+
+    supports:    new = old * (1 + weight * support_multiplier)
+    contradicts: new = old * (1 - weight * contradict_multiplier)
+    neutral:     new = old
+
+clamped to [confidence_floor, confidence_ceiling] after every piece of
+evidence. Status transitions use the `elimination:` thresholds. Evidence
+already applied to a hypothesis is skipped, and only hypotheses that had a
+bearing applied or changed status are rewritten, so re-running --evidence
+leaves the session files untouched.
+
+With NumPy installed, consecutive columns that touch disjoint hypotheses
+are grouped into waves and each wave is one np.clip(conf[rows] * factors)
+over the whole group; the clamp still happens after every record. Small
+checkpoints, and installs without NumPy, use the pure Python loop.
+--benchmark reports the ratio against the linear scalar loop.
+
+Usage:
+    # Apply specific evidence records to the active session
+    python .claude/scripts/elimination/eliminate_batch.py --evidence ev-005 ev-006
+
+    # Replay all evidence from each hypothesis' initial confidence
+    python .claude/scripts/elimination/eliminate_batch.py --replay
+
+    # Preview without writing files
+    python .claude/scripts/elimination/eliminate_batch.py --replay --dry-run
+
+    # Check batch vs the linear scalar loop at 10, 100 and 1000 hypotheses
+    python .claude/scripts/elimination/eliminate_batch.py --benchmark
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import yaml
+
+try:
+    import numpy as np
+except ImportError:  # Batch engine falls back to pure Python
+    np = None
+
+from eliminate_store import file_lock, open_store, save_evidence, save_hypothesis, store_exists
+
+ELIMINATION_DIR = Path(".elimination")
+CONFIG_FILE = ELIMINATION_DIR / "config.yaml"
+HYPOTHESES_DIR = ELIMINATION_DIR / "active" / "hypotheses"
+EVIDENCE_DIR = ELIMINATION_DIR / "active" / "evidence"
+
+# Defaults mirror .elimination/config.yaml
+DEFAULT_PARAMS = {
+    "support_multiplier": 0.5,
+    "contradict_multiplier": 0.7,
+    "confidence_floor": 0.01,
+    "confidence_ceiling": 0.99,
+    "hard_threshold": 0.05,
+    "soft_threshold": 0.25,
+    "confirmation_threshold": 0.90,
+    "require_minimum_evidence": 2,
+    "allow_resurrection": True,
+    "resurrection_threshold": 0.10,
+}
+
+TERMINAL_STATUSES = {"verified"}
+
+# Below this many bearings the NumPy setup costs more than it saves
+NUMPY_MIN_BEARINGS = 1000
+
+
+def now_iso():
+    """Current UTC time in the timestamp format used by session files."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def load_params(config_path=CONFIG_FILE):
+    """Read Bayesian and elimination parameters from config.yaml."""
+    params = dict(DEFAULT_PARAMS)
+    if not Path(config_path).exists():
+        return params
+    with open(config_path) as f:
+        config = yaml.safe_load(f) or {}
+    for section in ("bayesian", "elimination"):
+        for key, value in (config.get(section) or {}).items():
+            if key in params:
+                params[key] = value
+    return params
+
+
+def load_yaml_dir(directory, pattern):
+    """Load every YAML file matching pattern, keyed by its `id` field."""
+    records = {}
+    for path in sorted(Path(directory).glob(pattern)):
+        with open(path) as f:
+            data = yaml.safe_load(f) or {}
+        if "id" in data:
+            records[data["id"]] = (path, data)
+    return records
+
+
+def evidence_sort_key(record):
+    """Order evidence by iteration, then record time, then id."""
+    meta = record.get("metadata") or {}
+    return (meta.get("iteration") or 0, str(meta.get("recorded_at") or ""), record["id"])
+
+
+# ---------------------------------------------------------------------------
+# Update rules
+# ---------------------------------------------------------------------------
+
+def bearing_factor(direction, weight, params):
+    """Multiplicative factor for one bearing under the scalar rule."""
+    if direction == "supports":
+        return 1 + weight * params["support_multiplier"]
+    if direction == "contradicts":
+        return 1 - weight * params["contradict_multiplier"]
+    return 1.0
+
+
+def scalar_update(confidence, direction, weight, params):
+    """Reference scalar rule: one bearing applied to one hypothesis."""
+    new = confidence * bearing_factor(direction, weight, params)
+    return min(max(new, params["confidence_floor"]), params["confidence_ceiling"])
+
+
+def next_status(status, confidence, evidence_count, params):
+    """Status after a checkpoint, given the post-update confidence."""
+    if status in TERMINAL_STATUSES:
+        return status
+    if status == "eliminated":
+        if params["allow_resurrection"] and confidence >= params["resurrection_threshold"]:
+            return "active"
+        return "eliminated"
+    if confidence > params["confirmation_threshold"]:
+        return "confirmed"
+    if confidence < params["hard_threshold"] and evidence_count >= params["require_minimum_evidence"]:
+        return "eliminated"
+    if confidence < params["soft_threshold"]:
+        return "unlikely"
+    return "active"
+
+
+def already_applied(hypothesis, evidence_id):
+    """True when the evidence is linked to, or in the history of, the hypothesis."""
+    links = hypothesis.get("evidence") or {}
+    if any(e.get("id") == evidence_id for k in ("supporting", "contradicting", "neutral")
+           for e in links.get(k) or []):
+        return True
+    prefix = f"Evidence {evidence_id}:"
+    history = (hypothesis.get("confidence") or {}).get("history") or []
+    return any(str(h.get("reason", "")).startswith(prefix) for h in history)
+
+
+def build_columns(hypothesis_ids, evidence_records, skip=()):
+    """
+    Flatten evidence bearings into application order.
+
+    Returns a dict of parallel lists over the applied bearings: `rows`
+    (hypothesis index), `directions`, `weights` and `bearings` (the bearing
+    dicts themselves), plus `starts`
+    and `labels`: column j covers bearings starts[j]:starts[j + 1] and comes
+    from evidence labels[j]. A record that bears on the same hypothesis twice
+    is split across two columns so each column touches a row at most once.
+    Bearings whose (evidence id, hypothesis id) pair is in skip are left out.
+    """
+    row_of = {hyp_id: i for i, hyp_id in enumerate(hypothesis_ids)}
+    rows, bearings, starts, labels = [], [], [], []
+    for record in evidence_records:
+        pending = [b for b in (record.get("bearing") or []) if b.get("hypothesis_id") in row_of]
+        if skip:
+            pending = [b for b in pending if (record["id"], b["hypothesis_id"]) not in skip]
+        while pending:
+            targets = [row_of[b["hypothesis_id"]] for b in pending]
+            if len(set(targets)) == len(targets):
+                column, pending = pending, []
+            else:
+                seen, column, carry = set(), [], []
+                for bearing, row in zip(pending, targets):
+                    (carry if row in seen else column).append(bearing)
+                    seen.add(row)
+                targets = [row_of[b["hypothesis_id"]] for b in column]
+                pending = carry
+            starts.append(len(bearings))
+            labels.append(record)
+            rows.extend(targets)
+            bearings.extend(column)
+    return {
+        "rows": rows,
+        "directions": [b.get("direction", "neutral") for b in bearings],
+        "weights": [b.get("weight", 0.0) for b in bearings],
+        "bearings": bearings,
+        "starts": starts,
+        "labels": labels,
+    }
+
+
+def _waves(rows, starts):
+    """
+    Group consecutive columns into waves that touch each row at most once.
+
+    Within a wave no column reads a value another column wrote, so the whole
+    wave is one gather/multiply/clip/scatter. Returns bearing offsets of the
+    wave boundaries, ending with len(rows).
+    """
+    n = len(rows)
+    column = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+    order = np.argsort(rows * n + np.arange(n))
+    same_row = np.zeros(n, dtype=bool)
+    same_row[1:] = rows[order][1:] == rows[order][:-1]
+    previous = np.full(n, -1)
+    previous[order[same_row]] = column[order][np.flatnonzero(same_row) - 1]
+    latest_previous = np.maximum.reduceat(previous, starts).tolist()
+
+    bounds, wave_start = [0], 0
+    for j, prev in enumerate(latest_previous):
+        if prev >= wave_start:
+            bounds.append(int(starts[j]))
+            wave_start = j
+    bounds.append(n)
+    return bounds
+
+
+def batch_update(confidences, columns, params):
+    """
+    Apply flattened bearings (see build_columns) to a confidence vector.
+
+    Returns (final, after) where after[i] is the confidence of bearing i's
+    hypothesis right after that bearing was applied.
+    """
+    floor, ceiling = params["confidence_floor"], params["confidence_ceiling"]
+    if np is None or len(columns["rows"]) < NUMPY_MIN_BEARINGS:
+        conf = [float(c) for c in confidences]
+        after = []
+        for row, direction, weight in zip(columns["rows"], columns["directions"], columns["weights"]):
+            conf[row] = min(max(conf[row] * bearing_factor(direction, float(weight), params), floor), ceiling)
+            after.append(conf[row])
+        return conf, after
+
+    rows = np.asarray(columns["rows"], dtype=np.intp)
+    directions = np.asarray(columns["directions"], dtype=object)
+    weights = np.asarray(columns["weights"], dtype=np.float64)
+    support, contradict = params["support_multiplier"], params["contradict_multiplier"]
+    factors = np.where(directions == "supports", 1 + weights * support,
+                       np.where(directions == "contradicts", 1 - weights * contradict, 1.0))
+
+    conf = np.asarray(confidences, dtype=np.float64).copy()
+    after = np.empty(len(rows))
+    bounds = _waves(rows, np.asarray(columns["starts"], dtype=np.intp))
+    for lo, hi in zip(bounds, bounds[1:]):
+        wave = rows[lo:hi]
+        conf[wave] = np.clip(conf[wave] * factors[lo:hi], floor, ceiling)
+        after[lo:hi] = conf[wave]
+    return conf.tolist(), after.tolist()
+
+
+def scalar_replay(hypotheses, evidence_records, params):
+    """Reference replay: the scalar rule applied bearing by bearing, in order."""
+    result = dict(hypotheses)
+    for record in evidence_records:
+        for bearing in record.get("bearing") or []:
+            hyp_id = bearing.get("hypothesis_id")
+            if hyp_id in result:
+                result[hyp_id] = scalar_update(
+                    result[hyp_id],
+                    bearing.get("direction", "neutral"),
+                    float(bearing.get("weight", 0.0)),
+                    params,
+                )
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Session application
+# ---------------------------------------------------------------------------
+
+def trend_of(history):
+    """increasing / decreasing / stable from the last two history values."""
+    if len(history) < 2:
+        return "stable"
+    previous, latest = history[-2]["value"], history[-1]["value"]
+    if latest > previous:
+        return "increasing"
+    if latest < previous:
+        return "decreasing"
+    return "stable"
+
+
+def apply_evidence(hypotheses, evidence_records, params, replay=False, timestamp=None):
+    """
+    Apply evidence to loaded hypothesis documents in place.
+
+    hypotheses maps id -> hypothesis dict; evidence_records is ordered.
+    With replay=True confidences restart from `confidence.initial` and the
+    history is rebuilt; otherwise evidence already applied to a hypothesis
+    is skipped. Only hypotheses that had a bearing applied or changed status
+    are modified. Returns (transitions, updated, applied): a list of
+    (hyp_id, old_status, new_status), the ids of modified hypotheses and the
+    ids of evidence records with at least one applied bearing.
+    """
+    timestamp = timestamp or now_iso()
+    ids = list(hypotheses)
+    skip = set()
+    if not replay:
+        for record in evidence_records:
+            for bearing in record.get("bearing") or []:
+                hyp_id = bearing.get("hypothesis_id")
+                if hyp_id in hypotheses and already_applied(hypotheses[hyp_id], record["id"]):
+                    skip.add((record["id"], hyp_id))
+    start = []
+    for hyp_id in ids:
+        conf = hypotheses[hyp_id].setdefault("confidence", {})
+        if replay:
+            initial = conf.get("initial", conf.get("current", 0.0))
+            history = conf.get("history") or []
+            conf["history"] = [h for h in history if not str(h.get("reason", "")).startswith("Evidence ")]
+            if not conf["history"]:
+                conf["history"] = [{"timestamp": timestamp, "value": initial, "reason": "Initial"}]
+            start.append(float(initial))
+        else:
+            start.append(float(conf.get("current", conf.get("initial", 0.0))))
+
+    columns = build_columns(ids, evidence_records, skip)
+    final, after = batch_update(start, columns, params)
+
+    updated = set(range(len(ids))) if replay else set()
+    before = list(start)
+    starts = columns["starts"]
+    bearings = list(zip(columns["rows"], columns["directions"], columns["weights"], columns["bearings"], after))
+    for record, lo, hi in zip(columns["labels"], starts, starts[1:] + [len(bearings)]):
+        meta = record.get("metadata") or {}
+        when = meta.get("recorded_at") or timestamp
+        summary = record.get("description", "")
+        for row, direction, weight, bearing, value in bearings[lo:hi]:
+            hyp = hypotheses[ids[row]]
+            updated.add(row)
+            if direction != "neutral":
+                hyp["confidence"].setdefault("history", []).append({
+                    "timestamp": when,
+                    "value": value,
+                    "reason": f"Evidence {record['id']}: {summary}",
+                })
+            links = hyp.setdefault("evidence", {})
+            bucket = {"supports": "supporting", "contradicts": "contradicting"}.get(direction, "neutral")
+            linked = links.get(bucket) or []
+            if not any(e.get("id") == record["id"] for e in linked):
+                linked.append({"id": record["id"], "summary": summary, "weight": float(weight), "timestamp": when})
+            links[bucket] = linked
+            bearing["confidence_before"] = before[row]
+            bearing["confidence_after"] = value
+            before[row] = value
+
+    transitions = []
+    for row, hyp_id in enumerate(ids):
+        hyp = hypotheses[hyp_id]
+        conf = hyp["confidence"]
+        links = hyp.get("evidence") or {}
+        evidence_count = sum(len(links.get(k) or []) for k in ("supporting", "contradicting", "neutral"))
+        old_status = hyp.get("status", "active")
+        new_status = next_status(old_status, final[row], evidence_count, params)
+        if row not in updated and new_status == old_status:
+            continue
+        updated.add(row)
+        conf["current"] = final[row]
+        conf["trend"] = trend_of(conf.get("history") or [])
+        if new_status != old_status:
+            hyp["status"] = new_status
+            transitions.append((hyp_id, old_status, new_status))
+            if new_status == "eliminated":
+                rollback = hyp.setdefault("rollback_info", {})
+                rollback["elimination_reason"] = "Confidence below hard_threshold after checkpoint"
+                rollback["last_state_before_elimination"] = {"status": old_status, "confidence": start[row]}
+        hyp.setdefault("metadata", {})["last_updated"] = timestamp
+    applied = list(dict.fromkeys(record["id"] for record in columns["labels"]))
+    return transitions, [ids[row] for row in sorted(updated)], applied
+
+
+def write_yaml(path, data):
+    with open(path, "w") as f:
+        yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+
+
+def run(evidence_ids, replay, dry_run):
+    params = load_params()
+    hyp_files = load_yaml_dir(HYPOTHESES_DIR, "hyp-*.yaml")
+    ev_files = load_yaml_dir(EVIDENCE_DIR, "ev-*.yaml")
+
+    if not hyp_files:
+        print("No hypotheses found in .elimination/active/hypotheses/")
+        return 1
+
+    if replay:
+        selected = list(ev_files)
+    else:
+        missing = [e for e in evidence_ids if e not in ev_files]
+        if missing:
+            print(f"Unknown evidence: {', '.join(missing)}")
+            return 1
+        selected = evidence_ids
+    records = sorted((ev_files[e][1] for e in selected), key=evidence_sort_key)
+
+    hypotheses = {hyp_id: data for hyp_id, (_, data) in hyp_files.items()}
+    before = {hyp_id: (h.get("confidence") or {}).get("current") for hyp_id, h in hypotheses.items()}
+    if not replay:
+        for record in records:
+            for bearing in record.get("bearing") or []:
+                hyp = hypotheses.get(bearing.get("hypothesis_id"))
+                if hyp and already_applied(hyp, record["id"]):
+                    print(f"Skipping {record['id']} for {hyp['id']}: already applied")
+    transitions, updated, applied = apply_evidence(hypotheses, records, params, replay=replay)
+
+    print(f"Applied {len(applied)} evidence record(s) to {len(updated)} of {len(hypotheses)} hypotheses")
+    for hyp_id in updated:
+        hyp = hypotheses[hyp_id]
+        print(f"  {hyp_id}: {before[hyp_id]} -> {hyp['confidence']['current']:.4f} [{hyp.get('status')}]")
+    for hyp_id, old, new in transitions:
+        print(f"  {hyp_id}: {old} -> {new}")
+
+    if not updated:
+        print("Nothing to write")
+        return 0
+    if dry_run:
+        print("\n[DRY-RUN] No files written")
+        return 0
+
+    if store_exists():
+        # Keep the indexed store and the YAML export in step
+        with open_store() as conn:
+            for hyp_id in updated:
+                save_hypothesis(conn, hypotheses[hyp_id], hyp_files[hyp_id][0])
+            for ev_id in applied:
+                path, data = ev_files[ev_id]
+                save_evidence(conn, data, path)
+        return 0
+
+    for hyp_id in updated:
+        with file_lock(hyp_id):
+            write_yaml(hyp_files[hyp_id][0], hypotheses[hyp_id])
+    for ev_id in applied:
+        path, data = ev_files[ev_id]
+        write_yaml(path, data)
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+def synthetic_session(n_hypotheses, n_evidence, bearings_per_evidence, seed=0):
+    rng = random.Random(seed)
+    hypotheses = {f"hyp-{i:04d}": rng.uniform(0.05, 0.9) for i in range(n_hypotheses)}
+    ids = list(hypotheses)
+    records = []
+    for j in range(n_evidence):
+        targets = rng.sample(ids, min(bearings_per_evidence, len(ids)))
+        records.append({
+            "id": f"ev-{j:04d}",
+            "bearing": [
+                {
+                    "hypothesis_id": t,
+                    "direction": rng.choice(["supports", "contradicts", "neutral"]),
+                    "weight": round(rng.uniform(0.1, 1.0), 2),
+                }
+                for t in targets
+            ],
+        })
+    return hypotheses, records
+
+
+def benchmark(sizes=(10, 100, 1000), n_evidence=50, repeat=5):
+    """Time the batch engine against the linear scalar loop and check they agree."""
+    params = load_params()
+    print(f"Batch engine: {'numpy' if np is not None else 'pure python (numpy not installed)'}")
+    print(f"{'hypotheses':>10} {'bearings':>9} {'scalar ms':>10} {'batch ms':>9} {'ratio':>6}  identical")
+    for size in sizes:
+        hypotheses, records = synthetic_session(size, n_evidence, max(1, size // 2))
+        ids = list(hypotheses)
+        start = [hypotheses[i] for i in ids]
+        nnz = sum(len(r["bearing"]) for r in records)
+
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            expected = scalar_replay(hypotheses, records, params)
+        scalar_ms = (time.perf_counter() - t0) * 1000 / repeat
+
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            final, _ = batch_update(start, build_columns(ids, records), params)
+        batch_ms = (time.perf_counter() - t0) * 1000 / repeat
+
+        identical = all(final[i] == expected[hyp_id] for i, hyp_id in enumerate(ids))
+        print(f"{size:>10} {nnz:>9} {scalar_ms:>10.2f} {batch_ms:>9.2f} {scalar_ms / batch_ms:>5.2f}x  {identical}")
+        if not identical:
+            return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch Bayesian update for elimination sessions")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--evidence", nargs="+", metavar="EV_ID", help="Evidence IDs to apply")
+    group.add_argument("--replay", action="store_true", help="Replay all evidence from initial confidence")
+    group.add_argument("--benchmark", action="store_true", help="Time batch update against the scalar loop")
+    parser.add_argument("--dry-run", action="store_true", help="Show results without writing files")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        return benchmark()
+    return run(args.evidence or [], args.replay, args.dry_run)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
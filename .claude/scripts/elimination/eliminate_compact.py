@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+eliminate_compact.py - Archive compaction and indexed reader for .elimination/archive
+
+Packs month directories (.elimination/archive/{year}-{month}/session-*/)
+older than `archive.compress_after_days` into one LZMA-compressed zip per
+month, {year}-{month}.zip, with a sidecar {year}-{month}.index.json holding
+each session's id, symptom tags, confirmed domain, matched heuristics and
+outcome.
+
+A month that gains new session directories after it was compacted is
+merged into its existing zip and sidecar on the next --compact. If the
+sidecar is missing or does not cover every session in the zip, it is
+rebuilt from the packed session.yaml and hypothesis members.
+
+Zip members are compressed individually, so the reader can pull a single
+session without decompressing the rest of the month, and aggregate
+statistics (history search, heuristic success_rate) are computed from the
+sidecar indexes alone. Sessions not yet compacted are read from their
+directories.
+
+Usage:
+    # Compact months older than compress_after_days
+    python .claude/scripts/elimination/eliminate_compact.py --compact [--dry-run]
+
+    # Search the index
+    python .claude/scripts/elimination/eliminate_compact.py --list --tag api-timeout --outcome resolved
+
+    # Print one archived session
+    python .claude/scripts/elimination/eliminate_compact.py --show session-2026-01-18-001
+
+    # Heuristic statistics across the whole archive
+    python .claude/scripts/elimination/eliminate_compact.py --stats
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import time
+import zipfile
+from collections import defaultdict
+from pathlib import Path
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+ELIMINATION_DIR = Path(".elimination")
+ARCHIVE_DIR = ELIMINATION_DIR / "archive"
+CONFIG_FILE = ELIMINATION_DIR / "config.yaml"
+
+MONTH_RE = re.compile(r"^\d{4}-\d{2}$")
+CONFIRMED_STATUSES = ("confirmed", "verified")
+
+
+def load_compress_after_days(config_path=CONFIG_FILE):
+    if not Path(config_path).exists():
+        return 30
+    with open(config_path) as f:
+        config = yaml.safe_load(f) or {}
+    return (config.get("archive") or {}).get("compress_after_days", 30)
+
+
+def _heuristic_id(value):
+    """'heur-001: load_correlation_concurrency' -> 'heur-001'."""
+    return str(value).split(":", 1)[0].strip() if value else None
+
+
+def index_session(files):
+    """
+    Build an index record from a session's parsed files.
+
+    files maps relative path -> parsed YAML for one session directory.
+    """
+    session_doc = files.get("session.yaml") or {}
+    session = session_doc.get("session") or {}
+    hypotheses = [doc for rel, doc in files.items() if rel.startswith("hypotheses/") and doc]
+
+    tags = set()
+    confirmed = None
+    for hyp in hypotheses:
+        tags.update((hyp.get("metadata") or {}).get("context_tags") or [])
+        if hyp.get("status") in CONFIRMED_STATUSES:
+            if confirmed is None or (hyp.get("confidence") or {}).get("current", 0) > (
+                confirmed.get("confidence") or {}
+            ).get("current", 0):
+                confirmed = hyp
+
+    matched = [_heuristic_id(h) for h in (session.get("trigger") or {}).get("matched_heuristics") or []]
+    return {
+        "session_id": session.get("id"),
+        "problem_description": session.get("problem_description"),
+        "created_at": str(session.get("created_at") or ""),
+        "outcome": session.get("status"),
+        "symptom_tags": sorted(tags),
+        "confirmed_hypothesis": confirmed.get("id") if confirmed else None,
+        "confirmed_domain": confirmed.get("domain") if confirmed else None,
+        "confirmed_heuristic": (confirmed.get("metadata") or {}).get("heuristic_matched") if confirmed else None,
+        "matched_heuristics": [m for m in matched if m],
+    }
+
+
+def _read_session_dir(directory, index_only=False):
+    """Parse a session directory; index_only skips evidence and traces."""
+    files = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = Path(root) / name
+            rel = path.relative_to(directory).as_posix()
+            if not name.endswith((".yaml", ".yml")):
+                continue
+            if index_only and rel != "session.yaml" and not rel.startswith("hypotheses/"):
+                continue
+            with open(path) as f:
+                files[rel] = yaml.load(f, Loader=SafeLoader)
+    return files
+
+
+def _session_dirs(month_dir):
+    return sorted(p for p in Path(month_dir).iterdir() if p.is_dir() and (p / "session.yaml").exists())
+
+
+def _index_from_zip(archive):
+    """Index records for every session packed in an open month zip."""
+    members = defaultdict(dict)
+    for name in archive.namelist():
+        prefix, _, rel = name.partition("/")
+        if not rel or not rel.endswith((".yaml", ".yml")):
+            continue
+        if rel == "session.yaml" or rel.startswith("hypotheses/"):
+            members[prefix][rel] = yaml.load(archive.read(name), Loader=SafeLoader)
+    records = []
+    for prefix in sorted(members):
+        record = index_session(members[prefix])
+        record["session_id"] = record["session_id"] or prefix
+        record["member_prefix"] = prefix + "/"
+        records.append(record)
+    return records
+
+
+def _newest_mtime(directory):
+    newest = 0.0
+    for root, _, names in os.walk(directory):
+        for name in names:
+            newest = max(newest, (Path(root) / name).stat().st_mtime)
+    return newest
+
+
+# ---------------------------------------------------------------------------
+# Compaction
+# ---------------------------------------------------------------------------
+
+def compact_month(month_dir, dry_run=False):
+    """
+    Pack one month directory into {month}.zip + {month}.index.json.
+
+    If the month was compacted before, its sessions are added to the
+    existing container and sidecar. Returns the newly packed sessions.
+    """
+    month_dir = Path(month_dir)
+    container = month_dir.with_suffix(".zip")
+    sidecar = month_dir.with_suffix(".index.json")
+    existing = []
+    if container.exists():
+        with zipfile.ZipFile(container) as archive:
+            packed = {name.split("/", 1)[0] + "/" for name in archive.namelist() if "/" in name}
+            if sidecar.exists():
+                existing = json.loads(sidecar.read_text())["sessions"]
+            if {r.get("member_prefix") for r in existing} != packed:
+                # Sidecar lost or out of step with the zip: re-index the packed sessions
+                existing = _index_from_zip(archive)
+        duplicates = sorted(p.name for p in _session_dirs(month_dir) if p.name + "/" in packed)
+        if duplicates:
+            raise FileExistsError(f"{container.name} already holds {', '.join(duplicates)}")
+
+    sessions = []
+    for session_dir in _session_dirs(month_dir):
+        record = index_session(_read_session_dir(session_dir, index_only=True))
+        record["session_id"] = record["session_id"] or session_dir.name
+        record["member_prefix"] = session_dir.name + "/"
+        sessions.append(record)
+    if dry_run:
+        return sessions
+
+    tmp = container.with_suffix(".zip.tmp")
+    if container.exists():
+        shutil.copyfile(container, tmp)
+    with zipfile.ZipFile(tmp, "a" if container.exists() else "w", compression=zipfile.ZIP_LZMA) as archive:
+        for root, _, names in os.walk(month_dir):
+            for name in sorted(names):
+                path = Path(root) / name
+                archive.write(path, path.relative_to(month_dir).as_posix())
+    with zipfile.ZipFile(tmp) as archive:
+        bad = archive.testzip()
+        if bad:
+            tmp.unlink()
+            raise zipfile.BadZipFile(f"Corrupt member after packing: {bad}")
+
+    index = {"month": month_dir.name, "container": container.name, "sessions": existing + sessions}
+    sidecar_tmp = sidecar.with_suffix(".tmp")
+    sidecar_tmp.write_text(json.dumps(index, indent=2))
+    os.replace(tmp, container)
+    os.replace(sidecar_tmp, sidecar)
+    shutil.rmtree(month_dir)
+    return sessions
+
+
+def compact(archive_dir=ARCHIVE_DIR, older_than_days=None, dry_run=False):
+    """
+    Compact every month directory older than the threshold.
+
+    Returns (results, errors): sessions packed per month, and the error
+    message for each month that could not be compacted. A failed month is
+    left as it was and does not stop the others.
+    """
+    days = load_compress_after_days() if older_than_days is None else older_than_days
+    cutoff = time.time() - days * 86400
+    results, errors = {}, {}
+    for month_dir in sorted(Path(archive_dir).glob("*")):
+        if not (month_dir.is_dir() and MONTH_RE.match(month_dir.name)):
+            continue
+        if _newest_mtime(month_dir) > cutoff:
+            continue
+        try:
+            results[month_dir.name] = compact_month(month_dir, dry_run=dry_run)
+        except (OSError, zipfile.BadZipFile, ValueError, yaml.YAMLError) as e:
+            errors[month_dir.name] = str(e)
+    return results, errors
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+def iter_index(archive_dir=ARCHIVE_DIR):
+    """Yield index records for every archived session, compacted or not."""
+    archive_dir = Path(archive_dir)
+    for sidecar in sorted(archive_dir.glob("*.index.json")):
+        index = json.loads(sidecar.read_text())
+        for record in index["sessions"]:
+            yield {**record, "container": index["container"]}
+    for month_dir in sorted(archive_dir.glob("*")):
+        if month_dir.is_dir() and MONTH_RE.match(month_dir.name):
+            for session_dir in _session_dirs(month_dir):
+                record = index_session(_read_session_dir(session_dir, index_only=True))
+                record["session_id"] = record["session_id"] or session_dir.name
+                record["directory"] = str(session_dir)
+                yield record
+
+
+def search(archive_dir=ARCHIVE_DIR, tag=None, domain=None, outcome=None, text=None):
+    for record in iter_index(archive_dir):
+        if tag and tag not in record["symptom_tags"]:
+            continue
+        if domain and record["confirmed_domain"] != domain:
+            continue
+        if outcome and record["outcome"] != outcome:
+            continue
+        if text and text.lower() not in str(record.get("problem_description") or "").lower():
+            continue
+        yield record
+
+
+def load_session(session_id, archive_dir=ARCHIVE_DIR):
+    """
+    Return {relative path: parsed YAML} for one archived session, or None.
+
+    Sidecar indexes are searched first, then loose session directories by
+    name; only when neither matches are loose session.yaml files parsed.
+    """
+    archive_dir = Path(archive_dir)
+    for sidecar in sorted(archive_dir.glob("*.index.json")):
+        index = json.loads(sidecar.read_text())
+        for record in index["sessions"]:
+            if record["session_id"] != session_id:
+                continue
+            files = {}
+            prefix = record["member_prefix"]
+            with zipfile.ZipFile(archive_dir / index["container"]) as archive:
+                for name in archive.namelist():
+                    if name.startswith(prefix) and name.endswith((".yaml", ".yml")):
+                        files[name[len(prefix):]] = yaml.load(archive.read(name), Loader=SafeLoader)
+            return files
+
+    loose = [d for m in sorted(archive_dir.glob("*")) if m.is_dir() and MONTH_RE.match(m.name)
+             for d in _session_dirs(m)]
+    for session_dir in loose:
+        if session_dir.name == session_id:
+            return _read_session_dir(session_dir)
+    for session_dir in loose:
+        with open(session_dir / "session.yaml") as f:
+            session = (yaml.load(f, Loader=SafeLoader) or {}).get("session") or {}
+        if session.get("id") == session_id:
+            return _read_session_dir(session_dir)
+    return None
+
+
+def heuristic_stats(archive_dir=ARCHIVE_DIR):
+    """
+    times_triggered / successful_predictions / success_rate per heuristic.
+
+    A prediction counts as successful when the session's confirmed
+    hypothesis came from that heuristic.
+    """
+    stats = defaultdict(lambda: {"times_triggered": 0, "successful_predictions": 0})
+    for record in iter_index(archive_dir):
+        for heur_id in set(record["matched_heuristics"]):
+            stats[heur_id]["times_triggered"] += 1
+            if record["confirmed_heuristic"] == heur_id:
+                stats[heur_id]["successful_predictions"] += 1
+    for entry in stats.values():
+        entry["success_rate"] = round(entry["successful_predictions"] / entry["times_triggered"], 2)
+    return dict(stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact and query the elimination archive")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--compact", action="store_true", help="Pack old month directories")
+    group.add_argument("--list", action="store_true", help="List archived sessions from the index")
+    group.add_argument("--show", metavar="SESSION_ID", help="Print one archived session")
+    group.add_argument("--stats", action="store_true", help="Heuristic statistics across the archive")
+    parser.add_argument("--older-than", type=int, help="Override compress_after_days")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be compacted")
+    parser.add_argument("--tag", help="Filter by symptom tag")
+    parser.add_argument("--domain", help="Filter by confirmed domain")
+    parser.add_argument("--outcome", help="Filter by session outcome")
+    parser.add_argument("--search", help="Filter by problem description text")
+    args = parser.parse_args()
+
+    if args.compact:
+        results, errors = compact(older_than_days=args.older_than, dry_run=args.dry_run)
+        if not results and not errors:
+            print("Nothing to compact")
+        for month, sessions in results.items():
+            verb = "Would compact" if args.dry_run else "Compacted"
+            print(f"{verb} {month}: {len(sessions)} session(s)")
+        for month, message in errors.items():
+            print(f"Skipped {month}: {message}")
+        return 1 if errors else 0
+
+    if args.list:
+        count = 0
+        for record in search(tag=args.tag, domain=args.domain, outcome=args.outcome, text=args.search):
+            count += 1
+            print(f"{record['session_id']} [{record['outcome']}] "
+                  f"{record['confirmed_domain'] or '-'}: {record['problem_description']}")
+        print(f"\n{count} session(s)")
+        return 0
+
+    if args.show:
+        files = load_session(args.show)
+        if files is None:
+            print(f"Session not found: {args.show}")
+            return 1
+        for rel in sorted(files):
+            print(f"# --- {rel} ---")
+            print(yaml.dump(files[rel], default_flow_style=False, sort_keys=False, allow_unicode=True))
+        return 0
+
+    stats = heuristic_stats()
+    if not stats:
+        print("No heuristic triggers in the archive")
+        return 0
+    print(yaml.dump({"statistics": stats}, sort_keys=True), end="")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
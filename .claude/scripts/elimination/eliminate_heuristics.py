@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+eliminate_heuristics.py - Compiled trigger matcher for learned heuristics
+
+Builds an inverted token index over the `trigger_conditions` and
+`context_tags` of every heuristic in .elimination/learned/heuristics.yaml
+and matches a symptom against it without re-evaluating every condition.
+
+Tags come from a heuristic's `context_tags` when it defines them and from
+its `hypothesis_template.domain`, so `--tags concurrency` works against the
+shipped heuristics, which carry no context_tags.
+
+The compiled index is cached in .elimination/learned/.heuristics-index.json,
+keyed by the sha256 of the raw bytes of heuristics.yaml and config.yaml.
+Neither file is parsed unless that key changed. Heuristics with at least
+`heuristic_min_samples` triggers and a success_rate below
+`heuristic_deprecation_threshold` (or marked `deprecated: true`) are pruned
+from the index at build time.
+
+Usage:
+    # Rank heuristics for a symptom
+    python .claude/scripts/elimination/eliminate_heuristics.py --symptom "timeouts under peak load"
+
+    # Include context tags, return JSON
+    python .claude/scripts/elimination/eliminate_heuristics.py --symptom "..." --tags api-timeout --json
+
+    # Force a rebuild of the cached index
+    python .claude/scripts/elimination/eliminate_heuristics.py --rebuild
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import yaml
+
+ELIMINATION_DIR = Path(".elimination")
+CONFIG_FILE = ELIMINATION_DIR / "config.yaml"
+HEURISTICS_FILE = ELIMINATION_DIR / "learned" / "heuristics.yaml"
+INDEX_FILE = ELIMINATION_DIR / "learned" / ".heuristics-index.json"
+
+INDEX_VERSION = 2
+
+# Minimum fraction of a condition's tokens the symptom must contain
+MIN_CONDITION_SCORE = 0.34
+# Score added per matching context tag
+TAG_BONUS = 0.15
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "but", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "the", "to", "with", "etc",
+}
+
+
+def normalize(token):
+    """Lowercase token with a plain plural 's' stripped."""
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    tokens = re.findall(r"[a-z0-9]+", str(text).lower())
+    return {normalize(t) for t in tokens if t not in STOPWORDS}
+
+
+def learning_settings(config_raw):
+    """`learning:` settings from the raw bytes of config.yaml."""
+    settings = {"heuristic_min_samples": 3, "heuristic_deprecation_threshold": 0.40}
+    config = (yaml.safe_load(config_raw) if config_raw else None) or {}
+    learning = config.get("learning") or {}
+    settings.update({k: v for k, v in learning.items() if k in settings})
+    return settings
+
+
+def _read_bytes(path):
+    try:
+        return Path(path).read_bytes()
+    except FileNotFoundError:
+        return b""
+
+
+def is_deprecated(heuristic, settings):
+    if heuristic.get("deprecated"):
+        return True
+    stats = heuristic.get("statistics") or {}
+    samples = stats.get("times_triggered") or 0
+    if samples < settings["heuristic_min_samples"]:
+        return False
+    return (stats.get("success_rate") or 0.0) < settings["heuristic_deprecation_threshold"]
+
+
+def build_index(heuristics, settings):
+    """Compile heuristics into postings lists keyed by token and tag."""
+    entries, pruned = [], []
+    tokens = defaultdict(list)
+    tags = defaultdict(list)
+
+    for heuristic in heuristics:
+        if is_deprecated(heuristic, settings):
+            pruned.append(heuristic.get("id"))
+            continue
+        slot = len(entries)
+        template = heuristic.get("hypothesis_template") or {}
+        conditions = [c.get("condition", "") for c in heuristic.get("trigger_conditions") or []]
+        sizes = []
+        for cond_index, condition in enumerate(conditions):
+            cond_tokens = tokenize(condition)
+            sizes.append(len(cond_tokens))
+            for token in cond_tokens:
+                tokens[token].append([slot, cond_index])
+        heuristic_tags = {str(tag).lower() for tag in heuristic.get("context_tags") or []}
+        if template.get("domain"):
+            heuristic_tags.add(str(template["domain"]).lower())
+        for tag in sorted(heuristic_tags):
+            tags[tag].append(slot)
+        entries.append({
+            "id": heuristic.get("id"),
+            "name": heuristic.get("name"),
+            "domain": template.get("domain"),
+            "initial_confidence": template.get("initial_confidence"),
+            "conditions": conditions,
+            "condition_sizes": sizes,
+        })
+
+    return {
+        "version": INDEX_VERSION,
+        "entries": entries,
+        "tokens": dict(tokens),
+        "tags": dict(tags),
+        "pruned": pruned,
+    }
+
+
+def _fingerprint(heuristics_raw, config_raw):
+    digest = hashlib.sha256(heuristics_raw)
+    digest.update(b"\0")
+    digest.update(config_raw)
+    return digest.hexdigest()
+
+
+def load_index(heuristics_path=HEURISTICS_FILE, index_path=INDEX_FILE, rebuild=False, config_path=CONFIG_FILE):
+    """Return the compiled index, rebuilding the on-disk cache if stale."""
+    raw = Path(heuristics_path).read_bytes()
+    config_raw = _read_bytes(config_path)
+    fingerprint = _fingerprint(raw, config_raw)
+
+    index_path = Path(index_path)
+    if not rebuild and index_path.exists():
+        try:
+            cached = json.loads(index_path.read_text())
+            if cached.get("fingerprint") == fingerprint and cached.get("version") == INDEX_VERSION:
+                return cached
+        except (OSError, ValueError):
+            pass
+
+    data = yaml.safe_load(raw) or {}
+    index = build_index(data.get("heuristics") or [], learning_settings(config_raw))
+    index["fingerprint"] = fingerprint
+    tmp = index_path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(index))
+    tmp.replace(index_path)
+    return index
+
+
+def match(index, symptom, tags=(), top=5):
+    """
+    Rank heuristics against a symptom.
+
+    A heuristic scores the best fraction of any one trigger condition's
+    tokens found in the symptom, plus TAG_BONUS per matching context tag.
+    Returns hits ordered by score, then initial_confidence.
+    """
+    hits = defaultdict(int)
+    for token in tokenize(symptom):
+        for slot, cond_index in index["tokens"].get(token, ()):
+            hits[(slot, cond_index)] += 1
+
+    best = {}
+    for (slot, cond_index), count in hits.items():
+        size = index["entries"][slot]["condition_sizes"][cond_index] or 1
+        score = count / size
+        if score >= MIN_CONDITION_SCORE and score > best.get(slot, (0.0, None))[0]:
+            best[slot] = (score, cond_index)
+
+    tag_hits = defaultdict(list)
+    for tag in tags:
+        for slot in index["tags"].get(str(tag).lower(), ()):
+            tag_hits[slot].append(tag)
+
+    results = []
+    for slot in set(best) | set(tag_hits):
+        entry = index["entries"][slot]
+        score, cond_index = best.get(slot, (0.0, None))
+        results.append({
+            "id": entry["id"],
+            "name": entry["name"],
+            "domain": entry["domain"],
+            "initial_confidence": entry["initial_confidence"],
+            "score": round(score + TAG_BONUS * len(tag_hits[slot]), 4),
+            "matched_condition": entry["conditions"][cond_index] if cond_index is not None else None,
+            "matched_tags": tag_hits[slot],
+        })
+    results.sort(key=lambda r: (r["score"], r["initial_confidence"] or 0.0), reverse=True)
+    return results[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Match a symptom against learned heuristics")
+    parser.add_argument("--symptom", help="Symptom description to match")
+    parser.add_argument("--tags", nargs="*", default=[], help="Context tags for the session")
+    parser.add_argument("--top", type=int, default=5, help="Maximum heuristics to return")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the cached index")
+    parser.add_argument("--json", action="store_true", help="Output matches as JSON")
+    args = parser.parse_args()
+
+    if not HEURISTICS_FILE.exists():
+        print("No heuristics file found at .elimination/learned/heuristics.yaml")
+        return 1
+
+    started = time.perf_counter()
+    index = load_index(rebuild=args.rebuild)
+    loaded_ms = (time.perf_counter() - started) * 1000
+    if not args.symptom:
+        print(f"Index: {len(index['entries'])} heuristics, {len(index['tokens'])} tokens")
+        if index["pruned"]:
+            print(f"Pruned (deprecated): {', '.join(index['pruned'])}")
+        return 0
+
+    results = match(index, args.symptom, args.tags, args.top)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    if not results:
+        print("No matching heuristics")
+        return 0
+    for result in results:
+        print(f"{result['id']} {result['name']} (score {result['score']:.2f}, "
+              f"initial_confidence {result['initial_confidence']})")
+        if result["matched_condition"]:
+            print(f"  condition: {result['matched_condition']}")
+        if result["matched_tags"]:
+            print(f"  tags: {', '.join(result['matched_tags'])}")
+    print(f"\nMatched in {elapsed_ms:.3f} ms (index load {loaded_ms:.3f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
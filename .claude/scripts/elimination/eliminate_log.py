@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+eliminate_log.py - Append-only elimination log with rotating JSON-lines segments
+
+Replaces rewriting .elimination/logs/elimination_log.yaml on every decision.
+Each session logs to its own directory, .elimination/logs/segments/{session_id}/,
+so entry ids, summaries and exports never mix sessions. Entries without a
+session_id go to the active session (.elimination/active/session.yaml).
+Each entry is appended as one JSON line to the newest segment in that
+directory; segments rotate at MAX_SEGMENT_BYTES. The `summary:` statistics
+are kept in memory per entry and written to summary.json, with the segment
+position they cover, whenever the segment is synced, rotated or closed.
+
+fsync policy (--fsync or LogWriter(fsync=...)):
+    always  fsync after every entry
+    batch   fsync every FSYNC_BATCH entries, on rotation and on close (default)
+    never   leave flushing to the OS
+
+A LogWriter holds an exclusive flock on its directory's .lock for its lifetime, so
+concurrent writers queue instead of reusing entry ids. On open it truncates
+a torn final line left by a crash and replays any entries written after the
+summary's recorded position; --rebuild-summary recomputes it from scratch.
+
+Readers stream segments line by line, so history and audit queries never
+load the whole log. export_yaml() still produces today's
+elimination_log.yaml shape, for one session, on demand. Segments written
+directly under segments/ by earlier versions are split into per-session
+directories the next time the CLI runs.
+
+Usage:
+    # Append an entry (same fields as elimination_log.yaml entries)
+    python .claude/scripts/elimination/eliminate_log.py --append '{"hypothesis_id": "hyp-003", "action": "hard_eliminate", ...}'
+
+    # Stream history, optionally filtered (active session unless --session)
+    python .claude/scripts/elimination/eliminate_log.py --history --hypothesis hyp-003 --limit 20
+    python .claude/scripts/elimination/eliminate_log.py --history --session session-2026-01-18-001
+
+    # Show summary / rebuild it / export YAML / import an existing YAML log
+    python .claude/scripts/elimination/eliminate_log.py --summary
+    python .claude/scripts/elimination/eliminate_log.py --rebuild-summary
+    python .claude/scripts/elimination/eliminate_log.py --export .elimination/logs/elimination_log.yaml
+    python .claude/scripts/elimination/eliminate_log.py --import .elimination/logs/elimination_log.yaml
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import yaml
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+ELIMINATION_DIR = Path(".elimination")
+LOG_DIR = ELIMINATION_DIR / "logs"
+SEGMENT_DIR = LOG_DIR / "segments"
+SUMMARY_FILE = SEGMENT_DIR / "summary.json"
+LOCK_FILE = SEGMENT_DIR / ".lock"
+HYPOTHESES_DIR = ELIMINATION_DIR / "active" / "hypotheses"
+ACTIVE_SESSION_FILE = ELIMINATION_DIR / "active" / "session.yaml"
+YAML_LOG = LOG_DIR / "elimination_log.yaml"
+
+MAX_SEGMENT_BYTES = 1024 * 1024
+FSYNC_POLICIES = ("always", "batch", "never")
+FSYNC_BATCH = 32
+# Segment directory for entries logged outside any session
+NO_SESSION = "no-session"
+
+# action -> summary counter it increments
+ACTION_COUNTERS = {
+    "hard_eliminate": "hard_eliminations",
+    "soft_eliminate": "soft_eliminations",
+    "resurrect": "resurrections",
+    "confirm": "confirmations",
+}
+ELIMINATION_ACTIONS = ("hard_eliminate", "soft_eliminate")
+
+
+def now_iso():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def empty_summary():
+    return {
+        "session_id": None,
+        "entry_count": 0,
+        "total_eliminations": 0,
+        "hard_eliminations": 0,
+        "soft_eliminations": 0,
+        "resurrections": 0,
+        "confirmations": 0,
+        "confidence_at_elimination_sum": 0.0,
+        "hypotheses_seen": [],
+        # [segment number, byte offset] the summary accounts for
+        "position": [1, 0],
+    }
+
+
+def load_summary(path=SUMMARY_FILE):
+    if Path(path).exists():
+        with open(path) as f:
+            stored = json.load(f)
+        if "position" in stored:
+            return {**empty_summary(), **stored}
+        # Written before positions were tracked: recount from the segments
+    return empty_summary()
+
+
+def active_session_id(path=ACTIVE_SESSION_FILE):
+    """`session.id` of the active session, or None."""
+    if not Path(path).exists():
+        return None
+    with open(path) as f:
+        document = yaml.safe_load(f) or {}
+    return (document.get("session") or {}).get("id")
+
+
+def session_directory(session_id=None, root=SEGMENT_DIR):
+    """Segment directory of a session (the active session by default)."""
+    name = str(session_id or active_session_id() or NO_SESSION)
+    return Path(root) / re.sub(r"[^A-Za-z0-9._-]", "_", name)
+
+
+def session_hypothesis_count(session_id=None, directory=HYPOTHESES_DIR):
+    """Hypothesis files of a session; only the active session's are on disk."""
+    if session_id and session_id != active_session_id():
+        return 0
+    return sum(1 for _ in Path(directory).glob("hyp-*.yaml"))
+
+
+def public_summary(state, hypothesis_count=0):
+    """
+    Summary block in the elimination_log.yaml shape.
+
+    elimination_rate is eliminations over hypotheses in the session: the
+    larger of hypothesis_count and the hypotheses the log has seen.
+    """
+    total = state["total_eliminations"]
+    seen = max(hypothesis_count, len(state["hypotheses_seen"]))
+    summary = {key: state[key] for key in (
+        "total_eliminations", "hard_eliminations", "soft_eliminations", "resurrections", "confirmations",
+    )}
+    summary["elimination_rate"] = round(total / seen, 2) if seen else 0.0
+    summary["average_confidence_at_elimination"] = (
+        round(state["confidence_at_elimination_sum"] / total, 2) if total else 0.0
+    )
+    return summary
+
+
+def segment_paths(directory=SEGMENT_DIR):
+    return sorted(Path(directory).glob("segment-*.jsonl"))
+
+
+def _segment_number(path):
+    return int(re.search(r"segment-(\d+)", path.name).group(1))
+
+
+def _truncate_torn_tail(path):
+    """Cut a segment back to its last newline; returns bytes removed."""
+    with open(path, "r+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        if not size:
+            return 0
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return 0
+        keep = size
+        while keep > 0:
+            step = min(4096, keep)
+            f.seek(keep - step)
+            chunk = f.read(step)
+            newline = chunk.rfind(b"\n")
+            if newline != -1:
+                keep = keep - step + newline + 1
+                break
+            keep -= step
+        f.truncate(keep)
+        f.flush()
+        os.fsync(f.fileno())
+        return size - keep
+
+
+def _iter_lines_from(directory, position):
+    """Yield (segment number, end offset, line) for lines after position."""
+    start_number, start_offset = position
+    for path in segment_paths(directory):
+        number = _segment_number(path)
+        if number < start_number:
+            continue
+        with open(path, "rb") as f:
+            if number == start_number:
+                f.seek(start_offset)
+            for line in iter(f.readline, b""):
+                yield number, f.tell(), line
+
+
+def _account(state, seen, entry):
+    """Fold one entry into the summary counters."""
+    state["entry_count"] += 1
+    if entry.get("session_id") and not state["session_id"]:
+        state["session_id"] = entry["session_id"]
+    action = entry.get("action")
+    counter = ACTION_COUNTERS.get(action)
+    if counter:
+        state[counter] += 1
+    if action in ELIMINATION_ACTIONS:
+        state["total_eliminations"] += 1
+        outcome = entry.get("outcome") or {}
+        state["confidence_at_elimination_sum"] += float(outcome.get("new_confidence") or 0.0)
+    if entry.get("hypothesis_id"):
+        seen.add(entry["hypothesis_id"])
+
+
+def _write_summary(path, state, seen):
+    state["hypotheses_seen"] = sorted(seen)
+    tmp = Path(path).with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def _replay(directory, state, seen):
+    """Account for every complete line after state['position']."""
+    replayed = 0
+    for number, offset, line in _iter_lines_from(directory, state["position"]):
+        if line.strip():
+            try:
+                _account(state, seen, json.loads(line))
+                replayed += 1
+            except ValueError:
+                pass
+        state["position"] = [number, offset]
+    return replayed
+
+
+@contextmanager
+def _directory_lock(directory):
+    with open(Path(directory) / LOCK_FILE.name, "w") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def current_summary(directory=None):
+    """summary.json plus any entries appended since it was written (read-only)."""
+    directory = directory or session_directory()
+    state = load_summary(Path(directory) / SUMMARY_FILE.name)
+    seen = set(state["hypotheses_seen"])
+    _replay(directory, state, seen)
+    state["hypotheses_seen"] = sorted(seen)
+    return state
+
+
+def rebuild_summary(directory=None):
+    """Recompute summary.json from the segments; returns the entry count."""
+    directory = Path(directory or session_directory())
+    directory.mkdir(parents=True, exist_ok=True)
+    with _directory_lock(directory):
+        state, seen = empty_summary(), set()
+        _replay(directory, state, seen)
+        _write_summary(directory / SUMMARY_FILE.name, state, seen)
+    return state["entry_count"]
+
+
+class LogWriter:
+    """Appends entries to the newest segment and keeps the summary current."""
+
+    def __init__(self, directory=None, fsync="batch", max_bytes=MAX_SEGMENT_BYTES, session_id=None):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {', '.join(FSYNC_POLICIES)}")
+        if directory is None:
+            session_id = session_id or active_session_id()
+            directory = session_directory(session_id)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.summary_path = self.directory / SUMMARY_FILE.name
+        self.fsync = fsync
+        self.max_bytes = max_bytes
+        self._handle = None
+        self._lock = _directory_lock(self.directory)
+        self._lock.__enter__()
+        try:
+            segments = segment_paths(self.directory)
+            if segments:
+                _truncate_torn_tail(segments[-1])
+            self.state = load_summary(self.summary_path)
+            self._seen = set(self.state["hypotheses_seen"])
+            if _replay(self.directory, self.state, self._seen):
+                _write_summary(self.summary_path, self.state, self._seen)
+            self.state["session_id"] = self.state["session_id"] or session_id
+            self._unsynced = 0
+            self._number = _segment_number(segments[-1]) if segments else 1
+            self._open_segment()
+        except BaseException:
+            self._lock.__exit__(None, None, None)
+            raise
+
+    def _open_segment(self):
+        path = self.directory / f"segment-{self._number:06d}.jsonl"
+        self._handle = open(path, "a", encoding="utf-8")
+
+    def _sync(self):
+        self._handle.flush()
+        if self.fsync != "never":
+            os.fsync(self._handle.fileno())
+        self._unsynced = 0
+        self.state["position"] = [self._number, self._handle.tell()]
+        _write_summary(self.summary_path, self.state, self._seen)
+
+    def _rotate(self):
+        self._sync()
+        self._handle.close()
+        self._number += 1
+        self._open_segment()
+
+    def append(self, entry):
+        """Append one entry, assigning entry_id/timestamp if missing."""
+        entry = dict(entry)
+        entry.setdefault("entry_id", f"elog-{self.state['entry_count'] + 1:03d}")
+        entry.setdefault("timestamp", now_iso())
+        if not entry.get("session_id"):
+            entry["session_id"] = self.state["session_id"]
+        elif self.state["session_id"] and entry["session_id"] != self.state["session_id"]:
+            raise ValueError(
+                f"Entry belongs to session {entry['session_id']}; "
+                f"this writer logs {self.state['session_id']}"
+            )
+        _account(self.state, self._seen, entry)
+
+        line = json.dumps(entry, default=str, separators=(",", ":")) + "\n"
+        if self._handle.tell() and self._handle.tell() + len(line) > self.max_bytes:
+            self._rotate()
+        self._handle.write(line)
+        self._unsynced += 1
+        if self.fsync == "always" or (self.fsync == "batch" and self._unsynced >= FSYNC_BATCH):
+            self._sync()
+        else:
+            self._handle.flush()
+        return entry
+
+    def close(self):
+        if self._handle and not self._handle.closed:
+            self._sync()
+            self._handle.close()
+            self._lock.__exit__(None, None, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_entries(directory=None, hypothesis_id=None, action=None, session_id=None, since=None):
+    """
+    Stream log entries oldest first, filtering as they are read.
+
+    Reads the given segment directory, or else the directory of session_id
+    (the active session by default).
+    """
+    if directory is None:
+        directory = session_directory(session_id)
+    for path in segment_paths(directory):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Torn final line from a crash mid-append
+                    continue
+                if hypothesis_id and entry.get("hypothesis_id") != hypothesis_id:
+                    continue
+                if action and entry.get("action") != action:
+                    continue
+                if session_id and entry.get("session_id") != session_id:
+                    continue
+                if since and str(entry.get("timestamp", "")) < since:
+                    continue
+                yield entry
+
+
+def export_yaml(output, directory=None, session_id=None):
+    """Write one session's log in the elimination_log.yaml shape."""
+    if directory is None:
+        directory = session_directory(session_id)
+    state = current_summary(directory)
+    document = {
+        "session_id": state["session_id"],
+        "entries": list(iter_entries(directory)),
+        "summary": public_summary(state, session_hypothesis_count(session_id)),
+    }
+    output = Path(output)
+    tmp = output.with_suffix(output.suffix + ".tmp")
+    with open(tmp, "w") as f:
+        f.write("# Elimination Log\n")
+        f.write("# Exported from .elimination/logs/segments/ by eliminate_log.py\n\n")
+        yaml.dump(document, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    os.replace(tmp, output)
+    return len(document["entries"])
+
+
+def import_yaml(source, fsync="batch"):
+    """Append the entries of an existing elimination_log.yaml to the segments."""
+    with open(source) as f:
+        document = yaml.safe_load(f) or {}
+    count = 0
+    with LogWriter(fsync=fsync, session_id=document.get("session_id")) as writer:
+        for entry in document.get("entries") or []:
+            entry.setdefault("session_id", document.get("session_id"))
+            writer.append(entry)
+            count += 1
+    return count
+
+
+def split_legacy_segments(root=SEGMENT_DIR):
+    """
+    Move entries from segments written directly under root into per-session
+    directories. Returns the number of entries moved.
+    """
+    root = Path(root)
+    legacy = segment_paths(root)
+    if not legacy:
+        return 0
+    moved = 0
+    writers = {}
+    with _directory_lock(root):
+        try:
+            for entry in iter_entries(root):
+                session_id = entry.get("session_id") or NO_SESSION
+                if session_id not in writers:
+                    writers[session_id] = LogWriter(session_directory(session_id, root), session_id=session_id)
+                writers[session_id].append(entry)
+                moved += 1
+        finally:
+            for writer in writers.values():
+                writer.close()
+        for path in legacy:
+            path.unlink()
+        (root / SUMMARY_FILE.name).unlink(missing_ok=True)
+    return moved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Append-only elimination log")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--append", metavar="JSON", help="Append one entry")
+    group.add_argument("--history", action="store_true", help="Stream log entries")
+    group.add_argument("--summary", action="store_true", help="Show summary statistics")
+    group.add_argument("--rebuild-summary", action="store_true", help="Recompute the summary from the segments")
+    group.add_argument("--export", metavar="PATH", help="Export log as elimination_log.yaml")
+    group.add_argument("--import", dest="import_path", metavar="PATH", help="Import an existing YAML log")
+    parser.add_argument("--hypothesis", help="Filter history by hypothesis id")
+    parser.add_argument("--action", help="Filter history by action")
+    parser.add_argument("--session", help="Session to read (default: the active session)")
+    parser.add_argument("--limit", type=int, help="Show only the last N matching entries")
+    parser.add_argument("--fsync", choices=FSYNC_POLICIES, default="batch", help="fsync policy for appends")
+    args = parser.parse_args()
+
+    moved = split_legacy_segments()
+    if moved:
+        print(f"Moved {moved} entries into per-session segment directories")
+
+    if args.append:
+        try:
+            entry = json.loads(args.append)
+        except ValueError as e:
+            print(f"Invalid JSON: {e}")
+            return 1
+        with LogWriter(fsync=args.fsync, session_id=entry.get("session_id")) as writer:
+            entry = writer.append(entry)
+        print(f"Logged {entry['entry_id']}: {entry.get('action')} {entry.get('hypothesis_id', '')}")
+        return 0
+
+    if args.history:
+        entries = iter_entries(hypothesis_id=args.hypothesis, action=args.action, session_id=args.session)
+        if args.limit:
+            entries = deque(entries, maxlen=args.limit)
+        for entry in entries:
+            outcome = entry.get("outcome") or {}
+            change = ""
+            if "previous_confidence" in outcome and "new_confidence" in outcome:
+                change = f" {outcome['previous_confidence']} -> {outcome['new_confidence']}"
+            print(f"{entry.get('timestamp')} {entry.get('entry_id')} "
+                  f"{entry.get('action')} {entry.get('hypothesis_id', '')}{change}")
+        return 0
+
+    directory = session_directory(args.session)
+
+    if args.summary:
+        summary = public_summary(current_summary(directory), session_hypothesis_count(args.session))
+        print(yaml.dump({"summary": summary}, sort_keys=False), end="")
+        return 0
+
+    if args.rebuild_summary:
+        count = rebuild_summary(directory)
+        print(f"Rebuilt summary from {count} entries")
+        return 0
+
+    if args.export:
+        count = export_yaml(args.export, session_id=args.session)
+        print(f"Exported {count} entries to {args.export}")
+        return 0
+
+    count = import_yaml(args.import_path, fsync=args.fsync)
+    print(f"Imported {count} entries from {args.import_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+eliminate_pool.py - Concurrent dispatch for independent hypotheses
+
+Runs the research -> analysis -> test phases of several hypotheses at once
+on a bounded worker pool. Phases of one hypothesis stay in order; different
+hypotheses run side by side.
+
+Evidence produced by a phase is staged per hypothesis under
+.elimination/active/staging/{hyp_id}/ while holding that hypothesis' lock
+(an asyncio lock in-process plus a file lock in .elimination/active/locks/
+for subagents running elsewhere). merge_staged() then assigns sequential
+ev-NNN ids and writes the records into .elimination/active/evidence/ in one
+step, so the eliminate_checkpoint.py gate always sees a consistent snapshot.
+Each record is merged holding the locks of every hypothesis it bears on;
+eliminate_batch.py and eliminate_store.save_hypothesis() take the same
+locks when writing hypothesis files.
+
+Plan file format (JSON), one shell command per phase, any phase optional:
+    {
+      "hyp-001": {"research": "...", "analysis": "...", "test": "..."},
+      "hyp-004": {"test": "..."}
+    }
+A phase that exits 0 with a YAML/JSON mapping with a `bearing` list on stdout is staged
+as evidence.
+
+Usage:
+    # Run a plan with 4 workers, then merge staged evidence
+    python .claude/scripts/elimination/eliminate_pool.py --plan plan.json --workers 4
+
+    # Merge evidence staged by subagents
+    python .claude/scripts/elimination/eliminate_pool.py --merge
+
+    # Compare serial vs concurrent dispatch with fake agents
+    python .claude/scripts/elimination/eliminate_pool.py --benchmark
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+import uuid
+from contextlib import asynccontextmanager, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+
+import yaml
+
+from eliminate_store import file_lock, hypothesis_locks, open_store, save_evidence, store_exists
+
+ELIMINATION_DIR = Path(".elimination")
+ACTIVE_DIR = ELIMINATION_DIR / "active"
+EVIDENCE_DIR = ACTIVE_DIR / "evidence"
+STAGING_DIR = ACTIVE_DIR / "staging"
+
+PHASES = ("research", "analysis", "test")
+DEFAULT_WORKERS = 4
+
+
+def now_iso():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class HypothesisLocks:
+    """One asyncio lock per hypothesis, backed by a file lock."""
+
+    def __init__(self):
+        self._locks = {}
+
+    @asynccontextmanager
+    async def hold(self, hyp_id):
+        lock = self._locks.setdefault(hyp_id, asyncio.Lock())
+        async with lock:
+            # flock blocks, so take it off the event loop thread
+            ctx = file_lock(hyp_id)
+            await asyncio.to_thread(ctx.__enter__)
+            try:
+                yield
+            finally:
+                ctx.__exit__(None, None, None)
+
+
+def stage_evidence(hyp_id, record):
+    """Write an evidence record to the hypothesis' staging directory."""
+    directory = STAGING_DIR / hyp_id
+    directory.mkdir(parents=True, exist_ok=True)
+    record = dict(record)
+    record.setdefault("metadata", {}).setdefault("recorded_at", now_iso())
+    path = directory / f"{uuid.uuid4().hex}.yaml"
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        yaml.dump(record, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    os.replace(tmp, path)
+    return path
+
+
+def _next_evidence_number():
+    numbers = [0]
+    for path in EVIDENCE_DIR.glob("ev-*.yaml"):
+        match = re.match(r"ev-(\d+)$", path.stem)
+        if match:
+            numbers.append(int(match.group(1)))
+    return max(numbers) + 1
+
+
+def merge_staged():
+    """
+    Move all staged evidence into the evidence directory.
+
+    Records are ordered by (recorded_at, hypothesis id) and numbered after
+    the highest existing ev-NNN, all under the session-wide merge lock.
+    Each record is written while holding the locks of its staging
+    hypothesis and every hypothesis it bears on. Returns the new evidence
+    ids in order.
+    """
+    store = open_store() if store_exists() else nullcontext()
+    with file_lock("merge"), store as conn:
+        staged = []
+        for path in STAGING_DIR.glob("*/*.yaml"):
+            with open(path) as f:
+                record = yaml.safe_load(f) or {}
+            recorded_at = str((record.get("metadata") or {}).get("recorded_at") or "")
+            staged.append((recorded_at, path.parent.name, path, record))
+        staged.sort(key=lambda s: (s[0], s[1], s[2].name))
+
+        EVIDENCE_DIR.mkdir(parents=True, exist_ok=True)
+        number = _next_evidence_number()
+        merged = []
+        for _, staged_for, path, record in staged:
+            ev_id = f"ev-{number:03d}"
+            number += 1
+            record["id"] = ev_id
+            target = EVIDENCE_DIR / f"{ev_id}.yaml"
+            bearing_ids = [b.get("hypothesis_id") for b in record.get("bearing") or [] if b.get("hypothesis_id")]
+            with hypothesis_locks([staged_for, *bearing_ids]):
+                if conn is not None:
+                    save_evidence(conn, record, target)
+                else:
+                    with open(target, "w") as f:
+                        yaml.dump(record, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+                path.unlink()
+            merged.append(ev_id)
+        for directory in STAGING_DIR.glob("*"):
+            if directory.is_dir() and not any(directory.iterdir()):
+                directory.rmdir()
+        return merged
+
+
+# ---------------------------------------------------------------------------
+# Dispatch
+# ---------------------------------------------------------------------------
+
+async def shell_runner(hyp_id, phase, command):
+    """Run one phase command; parse stdout as evidence when possible."""
+    proc = await asyncio.create_subprocess_shell(
+        command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env={**os.environ, "ELIMINATION_HYPOTHESIS": hyp_id, "ELIMINATION_PHASE": phase},
+    )
+    stdout, stderr = await proc.communicate()
+    result = {"returncode": proc.returncode, "stderr": stderr.decode(errors="replace")}
+    try:
+        parsed = yaml.safe_load(stdout.decode(errors="replace"))
+    except yaml.YAMLError:
+        parsed = None
+    if isinstance(parsed, dict) and parsed.get("bearing"):
+        result["evidence"] = parsed
+    else:
+        result["output"] = stdout.decode(errors="replace")
+    return result
+
+
+async def _run_hypothesis(hyp_id, phases, runner, semaphore, locks, results):
+    for phase in PHASES:
+        if phase not in phases:
+            continue
+        async with semaphore:
+            started = time.perf_counter()
+            result = await runner(hyp_id, phase, phases[phase])
+            result["seconds"] = time.perf_counter() - started
+        results.append({"hypothesis_id": hyp_id, "phase": phase, **result})
+        if result.get("returncode", 0) != 0:
+            # A failed phase stops this hypothesis and its evidence is not
+            # staged; the other hypotheses carry on
+            break
+        if result.get("evidence"):
+            async with locks.hold(hyp_id):
+                await asyncio.to_thread(stage_evidence, hyp_id, result["evidence"])
+
+
+async def run_pool(plan, runner=shell_runner, workers=DEFAULT_WORKERS):
+    """Dispatch every hypothesis in plan across at most `workers` phases at once."""
+    semaphore = asyncio.Semaphore(max(1, workers))
+    locks = HypothesisLocks()
+    results = []
+    await asyncio.gather(*(
+        _run_hypothesis(hyp_id, phases, runner, semaphore, locks, results)
+        for hyp_id, phases in plan.items()
+    ))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Fake-agent benchmark
+# ---------------------------------------------------------------------------
+
+def fake_runner(latencies):
+    """Runner that sleeps like a subagent and returns a test result as evidence."""
+    async def run(hyp_id, phase, _spec):
+        await asyncio.sleep(latencies[(hyp_id, phase)])
+        if phase != "test":
+            return {"returncode": 0, "output": f"{phase} done"}
+        return {
+            "returncode": 0,
+            "evidence": {
+                "type": "test_result",
+                "description": f"Fake test for {hyp_id}",
+                "bearing": [{"hypothesis_id": hyp_id, "direction": "supports", "weight": 0.5}],
+            },
+        }
+    return run
+
+
+def benchmark(hypotheses=(5, 10), workers=4, seed=0):
+    rng = random.Random(seed)
+    cwd = os.getcwd()
+    print(f"{'hypotheses':>10} {'serial s':>9} {'pool s':>8} {'speedup':>8}  merged")
+    try:
+        for count in hypotheses:
+            plan = {f"hyp-{i:03d}": {p: "" for p in PHASES} for i in range(1, count + 1)}
+            latencies = {(h, p): rng.uniform(0.05, 0.2) for h in plan for p in PHASES}
+            timings = []
+            for pool_size in (1, workers):
+                with tempfile.TemporaryDirectory() as tmp:
+                    os.chdir(tmp)
+                    started = time.perf_counter()
+                    asyncio.run(run_pool(plan, fake_runner(latencies), pool_size))
+                    merged = merge_staged()
+                    timings.append(time.perf_counter() - started)
+                    os.chdir(cwd)
+            serial, pooled = timings
+            print(f"{count:>10} {serial:>9.2f} {pooled:>8.2f} {serial / pooled:>7.1f}x  {len(merged)}")
+    finally:
+        os.chdir(cwd)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent dispatch for elimination hypotheses")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--plan", help="JSON plan of phase commands per hypothesis")
+    group.add_argument("--merge", action="store_true", help="Merge staged evidence into the session")
+    group.add_argument("--benchmark", action="store_true", help="Serial vs concurrent fake-agent run")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Maximum concurrent phases")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        return benchmark(workers=args.workers)
+
+    failed = 0
+    if args.plan:
+        with open(args.plan) as f:
+            plan = json.load(f)
+        results = asyncio.run(run_pool(plan, workers=args.workers))
+        for result in sorted(results, key=lambda r: (r["hypothesis_id"], PHASES.index(r["phase"]))):
+            ok = result.get("returncode", 0) == 0
+            failed += not ok
+            mark = "✓" if ok else "✗"
+            print(f"{mark} {result['hypothesis_id']} {result['phase']} ({result['seconds']:.1f}s)")
+            if not ok:
+                print(f"    exit {result.get('returncode')}")
+                for line in (result.get("stderr") or "").rstrip().splitlines():
+                    print(f"    {line}")
+        if failed:
+            print(f"\n{failed} phase(s) failed; evidence from successful phases is still merged")
+
+    merged = merge_staged()
+    if merged:
+        print(f"\nMerged evidence: {' '.join(merged)}")
+        print("Next: run the checkpoint gate for these records")
+    else:
+        print("\nNo staged evidence to merge")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+eliminate_schedule.py - Information-gain test scheduler for elimination sessions
+
+Ranks every `suggested_tests` entry of every open hypothesis by expected
+entropy reduction over the hypothesis set and returns a top-k plan.
+
+Each hypothesis' confidence c is treated as an independent belief, so the
+set's entropy is the sum of binary entropies H(c). A test written for
+hypothesis h shows `expected_if_true` with probability r when h holds and
+1 - r when it does not, where r comes from the test's priority. Its expected
+information gain is then
+
+    IG = H(c * r + (1 - c) * (1 - r)) - H(r)
+
+which depends only on c and r. Scores are cached in
+.elimination/active/schedule_cache.json keyed by each hypothesis'
+confidence, status and test list, so new evidence only invalidates the
+hypotheses it touched.
+
+With the session store (eliminate_store.py) present, each iteration reads
+only the indexed (status, confidence, mtime, size) columns; documents are
+loaded just for hypotheses whose file changed since their scores were
+cached, and tests already run come from the indexed performed_tests table.
+A suggested test counts as run once an evidence record names it in
+`test_performed.suggested_test` (hypothesis_id and index into that
+hypothesis' suggested_tests).
+Without the store every YAML file is parsed.
+
+Usage:
+    # Top 3 tests to run next
+    python .claude/scripts/elimination/eliminate_schedule.py
+
+    # Top 5 as JSON
+    python .claude/scripts/elimination/eliminate_schedule.py --top 5 --json
+
+    # Drop cached scores for specific hypotheses
+    python .claude/scripts/elimination/eliminate_schedule.py --invalidate hyp-001 hyp-004
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import math
+import sys
+from pathlib import Path
+
+import yaml
+
+from eliminate_batch import load_yaml_dir
+from eliminate_store import (
+    SCHEMA_VERSION,
+    open_store,
+    performed_tests,
+    schema_version,
+    store_exists,
+    suggested_test_of,
+    sync_from_yaml,
+)
+
+ELIMINATION_DIR = Path(".elimination")
+CONFIG_FILE = ELIMINATION_DIR / "config.yaml"
+HYPOTHESES_DIR = ELIMINATION_DIR / "active" / "hypotheses"
+EVIDENCE_DIR = ELIMINATION_DIR / "active" / "evidence"
+CACHE_FILE = ELIMINATION_DIR / "active" / "schedule_cache.json"
+
+# Probability a test shows its expected outcome, by suggested priority
+TEST_RELIABILITY = {"high": 0.90, "medium": 0.75, "low": 0.60}
+DEFAULT_RELIABILITY = 0.75
+
+OPEN_STATUSES = ("active", "unlikely")
+
+
+def load_convergence(config_path=CONFIG_FILE):
+    defaults = {
+        "min_information_gain": 0.01,
+        "separation_margin": 0.30,
+        "confidence_ceiling": 0.95,
+    }
+    if not Path(config_path).exists():
+        return defaults
+    with open(config_path) as f:
+        config = yaml.safe_load(f) or {}
+    defaults.update({k: v for k, v in (config.get("convergence") or {}).items() if k in defaults})
+    return defaults
+
+
+def binary_entropy(p):
+    if p <= 0.0 or p >= 1.0:
+        return 0.0
+    return -(p * math.log2(p) + (1 - p) * math.log2(1 - p))
+
+
+def expected_information_gain(confidence, reliability):
+    """Expected entropy reduction from one test on a hypothesis."""
+    p_true_outcome = confidence * reliability + (1 - confidence) * (1 - reliability)
+    return binary_entropy(p_true_outcome) - binary_entropy(reliability)
+
+
+def _cache_key(hyp):
+    confidence = (hyp.get("confidence") or {}).get("current", 0.0)
+    tests = json.dumps(hyp.get("suggested_tests") or [], sort_keys=True, default=str)
+    digest = hashlib.sha256(tests.encode()).hexdigest()[:16]
+    return [float(confidence or 0.0), hyp.get("status", "active"), digest]
+
+
+class ScoreCache:
+    """Per-hypothesis test scores, persisted between loop iterations."""
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = Path(path)
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def fresh(self, hyp_id, stamp):
+        """True when cached scores were computed from the file with this (mtime_ns, size)."""
+        cached = self.entries.get(hyp_id)
+        return bool(cached) and cached.get("stamp") == list(stamp)
+
+    def scores(self, hyp):
+        """Scored tests for a hypothesis, recomputed only if its key changed."""
+        cached = self.entries.get(hyp["id"])
+        stamp = hyp.get("_stamp")
+        if stamp is not None and cached and cached.get("stamp") == stamp:
+            self.hits += 1
+            return cached["tests"]
+        key = _cache_key(hyp)
+        if cached and cached["key"] == key:
+            self.hits += 1
+            if stamp is not None:
+                cached["stamp"] = stamp
+            return cached["tests"]
+
+        self.misses += 1
+        confidence = key[0]
+        tests = []
+        for index, test in enumerate(hyp.get("suggested_tests") or []):
+            priority = test.get("priority", "medium")
+            reliability = TEST_RELIABILITY.get(priority, DEFAULT_RELIABILITY)
+            tests.append({
+                "index": index,
+                "description": test.get("description", ""),
+                "expected_if_true": test.get("expected_if_true"),
+                "expected_if_false": test.get("expected_if_false"),
+                "priority": priority,
+                "information_gain": expected_information_gain(confidence, reliability),
+            })
+        self.entries[hyp["id"]] = {"key": key, "stamp": stamp, "tests": tests}
+        return tests
+
+    def invalidate(self, hyp_ids):
+        for hyp_id in hyp_ids:
+            self.entries.pop(hyp_id, None)
+
+    def prune(self, live_ids):
+        for hyp_id in list(self.entries):
+            if hyp_id not in live_ids:
+                del self.entries[hyp_id]
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.entries))
+        tmp.replace(self.path)
+
+
+def _load_from_store(conn, cache):
+    """
+    Hypotheses from the index, parsing documents only for changed files.
+
+    Hypotheses whose cached scores match their file's (mtime_ns, size) are
+    returned as stubs carrying just id, status, confidence and `_stamp`.
+    """
+    hypotheses, stale = [], []
+    for row in conn.execute("SELECT id, status, confidence, mtime_ns, size FROM hypotheses"):
+        stamp = [row["mtime_ns"], row["size"]]
+        if cache.fresh(row["id"], stamp):
+            hypotheses.append({
+                "id": row["id"],
+                "status": row["status"],
+                "confidence": {"current": row["confidence"]},
+                "_stamp": stamp,
+            })
+        else:
+            stale.append(row["id"])
+    for start in range(0, len(stale), 500):
+        chunk = stale[start:start + 500]
+        rows = conn.execute(
+            f"SELECT doc, mtime_ns, size FROM hypotheses WHERE id IN ({','.join('?' * len(chunk))})", chunk
+        )
+        for row in rows:
+            hyp = json.loads(row["doc"])
+            hyp["_stamp"] = [row["mtime_ns"], row["size"]]
+            hypotheses.append(hyp)
+    return hypotheses, performed_tests(conn)
+
+
+def load_session(cache=None):
+    """Return (hypotheses, performed_tests) from the store or YAML files."""
+    if store_exists():
+        with open_store() as conn:
+            if schema_version(conn) >= SCHEMA_VERSION:
+                sync_from_yaml(conn)
+                return _load_from_store(conn, cache if cache is not None else ScoreCache())
+
+    hypotheses = [data for _, data in load_yaml_dir(HYPOTHESES_DIR, "hyp-*.yaml").values()]
+    evidence = [data for _, data in load_yaml_dir(EVIDENCE_DIR, "ev-*.yaml").values()]
+
+    performed = {suggested_test_of(record) for record in evidence} - {None}
+    return hypotheses, performed
+
+
+def plan(hypotheses, convergence, performed=(), top=3, cache=None):
+    """
+    Rank untried suggested tests by expected information gain.
+
+    convergence is the parsed `convergence:` config (load_convergence());
+    performed holds (hypothesis_id, test index) pairs already run. Returns a dict with the ordered `plan`, whether the session has
+    converged, and why.
+    """
+    cache = cache if cache is not None else ScoreCache()
+    performed = set(performed)
+
+    open_hyps = [h for h in hypotheses if h.get("status", "active") in OPEN_STATUSES]
+    cache.prune({h["id"] for h in hypotheses})
+
+    candidates = []
+    for hyp in open_hyps:
+        confidence = (hyp.get("confidence") or {}).get("current", 0.0)
+        for test in cache.scores(hyp):
+            if (hyp["id"], test["index"]) in performed:
+                continue
+            candidates.append({"hypothesis_id": hyp["id"], "confidence": confidence, **test})
+
+    ranked = heapq.nlargest(top, candidates, key=lambda t: (t["information_gain"], t["confidence"]))
+    useful = [t for t in ranked if t["information_gain"] >= convergence["min_information_gain"]]
+
+    confidences = sorted(
+        ((h.get("confidence") or {}).get("current", 0.0) for h in open_hyps), reverse=True
+    )
+    reasons = []
+    if confidences and confidences[0] >= convergence["confidence_ceiling"]:
+        reasons.append(f"leading confidence {confidences[0]:.2f} >= {convergence['confidence_ceiling']}")
+    if len(confidences) > 1 and confidences[0] - confidences[1] >= convergence["separation_margin"]:
+        reasons.append(f"separation {confidences[0] - confidences[1]:.2f} >= {convergence['separation_margin']}")
+    if not useful:
+        reasons.append(f"no test exceeds min_information_gain {convergence['min_information_gain']}")
+
+    return {
+        "plan": useful,
+        "converged": bool(reasons),
+        "reasons": reasons,
+        "candidates": len(candidates),
+        "cache": {"hits": cache.hits, "misses": cache.misses},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank suggested tests by expected information gain")
+    parser.add_argument("--top", type=int, default=3, help="Number of tests to return")
+    parser.add_argument("--json", action="store_true", help="Output plan as JSON")
+    parser.add_argument("--invalidate", nargs="+", metavar="HYP_ID", help="Drop cached scores and exit")
+    args = parser.parse_args()
+
+    cache = ScoreCache()
+    if args.invalidate:
+        cache.invalidate(args.invalidate)
+        cache.save()
+        print(f"Invalidated {len(args.invalidate)} hypothesis score(s)")
+        return 0
+
+    hypotheses, performed = load_session(cache)
+    if not hypotheses:
+        print("No hypotheses found in .elimination/active/hypotheses/")
+        return 1
+
+    result = plan(hypotheses, load_convergence(), performed, top=args.top, cache=cache)
+    cache.save()
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    print(f"Candidates: {result['candidates']} "
+          f"(cache: {result['cache']['hits']} hit, {result['cache']['misses']} recomputed)")
+    for rank, test in enumerate(result["plan"], 1):
+        print(f"\n{rank}. [{test['hypothesis_id']}] {test['description']}")
+        print(f"   Expected gain: {test['information_gain']:.3f} bits (priority: {test['priority']})")
+        if test.get("expected_if_true"):
+            print(f"   If true:  {test['expected_if_true']}")
+        if test.get("expected_if_false"):
+            print(f"   If false: {test['expected_if_false']}")
+    if result["converged"]:
+        print("\nConvergence: " + "; ".join(result["reasons"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
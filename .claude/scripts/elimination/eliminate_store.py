@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+eliminate_store.py - Indexed SQLite store for the active elimination session
+
+The YAML files under .elimination/active/hypotheses/ and
+.elimination/active/evidence/ remain the human-readable source of record.
+This optional store mirrors them into .elimination/active/session.db with
+indexes on hypothesis status, domain, confidence and evidence -> hypothesis
+bearings, so status and next-hypothesis queries no longer re-parse every file.
+
+Files are tracked by (mtime_ns, size); a sync only re-parses files that
+changed since the last sync. Writes made through save_hypothesis() and
+save_evidence() update the YAML export and the index together.
+
+save_hypothesis() holds the hypothesis' file lock
+(.elimination/active/locks/{hyp_id}.lock) while writing, the same lock
+eliminate_pool.py takes when merging staged evidence.
+
+--status and --next sync before answering: one stat per file, and only
+files edited since the last sync (including in-place hand edits) are
+re-parsed.
+
+Usage:
+    # Import an existing active session (creates session.db)
+    python .claude/scripts/elimination/eliminate_store.py --import
+
+    # Check whether the active session needs importing or re-syncing
+    python .claude/scripts/elimination/eliminate_store.py --check
+
+    # Indexed status summary / next hypothesis
+    python .claude/scripts/elimination/eliminate_store.py --status
+    python .claude/scripts/elimination/eliminate_store.py --next
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+
+import yaml
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+ELIMINATION_DIR = Path(".elimination")
+ACTIVE_DIR = ELIMINATION_DIR / "active"
+HYPOTHESES_DIR = ACTIVE_DIR / "hypotheses"
+EVIDENCE_DIR = ACTIVE_DIR / "evidence"
+STORE_FILE = ACTIVE_DIR / "session.db"
+LOCK_DIR = ACTIVE_DIR / "locks"
+
+SCHEMA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS hypotheses (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    domain TEXT,
+    confidence REAL NOT NULL,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    doc TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS evidence (
+    id TEXT PRIMARY KEY,
+    type TEXT,
+    recorded_at TEXT,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    doc TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bearings (
+    evidence_id TEXT NOT NULL REFERENCES evidence(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    hypothesis_id TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    weight REAL NOT NULL,
+    PRIMARY KEY (evidence_id, position)
+);
+CREATE TABLE IF NOT EXISTS performed_tests (
+    evidence_id TEXT NOT NULL REFERENCES evidence(id) ON DELETE CASCADE,
+    hypothesis_id TEXT NOT NULL,
+    test_index INTEGER NOT NULL,
+    PRIMARY KEY (evidence_id, hypothesis_id, test_index)
+);
+CREATE INDEX IF NOT EXISTS idx_hypotheses_status_confidence ON hypotheses(status, confidence DESC);
+CREATE INDEX IF NOT EXISTS idx_hypotheses_domain ON hypotheses(domain);
+CREATE INDEX IF NOT EXISTS idx_hypotheses_confidence ON hypotheses(confidence DESC);
+CREATE INDEX IF NOT EXISTS idx_bearings_hypothesis ON bearings(hypothesis_id, direction);
+CREATE INDEX IF NOT EXISTS idx_performed_hypothesis ON performed_tests(hypothesis_id);
+"""
+
+
+@contextmanager
+def open_store(path=STORE_FILE):
+    """Open (creating if needed) the session store and commit on exit."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    try:
+        _migrate(conn)
+        conn.executescript(SCHEMA)
+        conn.execute(
+            "INSERT OR IGNORE INTO meta(key, value) VALUES ('schema_version', ?)",
+            (str(SCHEMA_VERSION),),
+        )
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _migrate(conn):
+    """Bring a store written by an older version of this script up to SCHEMA_VERSION."""
+    tables = {r["name"] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    if "meta" not in tables or schema_version(conn) >= SCHEMA_VERSION:
+        return
+    # v3 keys performed tests by suggested-test index; force evidence to re-sync to refill them
+    conn.execute("DROP TABLE IF EXISTS performed_tests")
+    if "evidence" in tables:
+        conn.execute("UPDATE evidence SET mtime_ns = 0")
+    conn.execute("UPDATE meta SET value = ? WHERE key = 'schema_version'", (str(SCHEMA_VERSION),))
+
+
+@contextmanager
+def file_lock(name):
+    """Exclusive advisory lock on .elimination/active/locks/{name}.lock."""
+    LOCK_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_DIR / f"{name}.lock", "w") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+@contextmanager
+def hypothesis_locks(hyp_ids):
+    """Hold the file locks of several hypotheses, taken in sorted order."""
+    with ExitStack() as stack:
+        for hyp_id in sorted(set(hyp_ids)):
+            stack.enter_context(file_lock(hyp_id))
+        yield
+
+
+def store_exists(path=STORE_FILE):
+    return Path(path).exists()
+
+
+def schema_version(conn):
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    return int(row["value"]) if row else 0
+
+
+# ---------------------------------------------------------------------------
+# YAML <-> store sync
+# ---------------------------------------------------------------------------
+
+def _scan(directory, pattern):
+    """Map path -> (mtime_ns, size) without parsing any file."""
+    found = {}
+    for path in Path(directory).glob(pattern):
+        st = path.stat()
+        found[str(path)] = (st.st_mtime_ns, st.st_size)
+    return found
+
+
+def suggested_test_of(record):
+    """
+    (hypothesis_id, index) of the suggested test an evidence record ran.
+
+    Read from `test_performed.suggested_test`; None when the record does not
+    name one.
+    """
+    ref = (record.get("test_performed") or {}).get("suggested_test") or {}
+    if not isinstance(ref, dict) or not ref.get("hypothesis_id"):
+        return None
+    try:
+        return ref["hypothesis_id"], int(ref.get("index", 0))
+    except (TypeError, ValueError):
+        return None
+
+
+def _upsert_hypothesis(conn, path, data, stat):
+    confidence = (data.get("confidence") or {}).get("current", 0.0)
+    conn.execute(
+        "DELETE FROM hypotheses WHERE path = ? AND id != ?", (str(path), data["id"])
+    )
+    conn.execute(
+        """INSERT OR REPLACE INTO hypotheses(id, status, domain, confidence, path, mtime_ns, size, doc)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        (
+            data["id"],
+            data.get("status", "active"),
+            data.get("domain"),
+            float(confidence or 0.0),
+            str(path),
+            stat[0],
+            stat[1],
+            json.dumps(data, default=str),
+        ),
+    )
+
+
+def _upsert_evidence(conn, path, data, stat):
+    conn.execute("DELETE FROM evidence WHERE path = ? AND id != ?", (str(path), data["id"]))
+    conn.execute("DELETE FROM bearings WHERE evidence_id = ?", (data["id"],))
+    conn.execute(
+        """INSERT OR REPLACE INTO evidence(id, type, recorded_at, path, mtime_ns, size, doc)
+           VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        (
+            data["id"],
+            data.get("type"),
+            str((data.get("metadata") or {}).get("recorded_at") or ""),
+            str(path),
+            stat[0],
+            stat[1],
+            json.dumps(data, default=str),
+        ),
+    )
+    conn.executemany(
+        """INSERT INTO bearings(evidence_id, position, hypothesis_id, direction, weight)
+           VALUES (?, ?, ?, ?, ?)""",
+        [
+            (
+                data["id"],
+                i,
+                b.get("hypothesis_id"),
+                b.get("direction", "neutral"),
+                float(b.get("weight", 0.0)),
+            )
+            for i, b in enumerate(data.get("bearing") or [])
+            if b.get("hypothesis_id")
+        ],
+    )
+    conn.execute("DELETE FROM performed_tests WHERE evidence_id = ?", (data["id"],))
+    suggested = suggested_test_of(data)
+    if suggested:
+        conn.execute(
+            "INSERT OR IGNORE INTO performed_tests(evidence_id, hypothesis_id, test_index) VALUES (?, ?, ?)",
+            (data["id"], *suggested),
+        )
+
+
+def _sync_table(conn, table, directory, pattern, upsert):
+    on_disk = _scan(directory, pattern)
+    indexed = {
+        row["path"]: (row["mtime_ns"], row["size"])
+        for row in conn.execute(f"SELECT path, mtime_ns, size FROM {table}")
+    }
+    changed = [p for p, stat in on_disk.items() if indexed.get(p) != stat]
+    removed = [p for p in indexed if p not in on_disk]
+
+    for path in changed:
+        with open(path) as f:
+            data = yaml.safe_load(f) or {}
+        if "id" in data:
+            upsert(conn, path, data, on_disk[path])
+    if removed:
+        conn.executemany(f"DELETE FROM {table} WHERE path = ?", [(p,) for p in removed])
+    return len(changed), len(removed)
+
+
+def sync_from_yaml(conn):
+    """
+    Re-index hypothesis and evidence files that changed on disk.
+
+    Costs one stat per file; only files whose (mtime_ns, size) differ from
+    the indexed values are parsed, so calling it before every query is cheap.
+    """
+    hyp = _sync_table(conn, "hypotheses", HYPOTHESES_DIR, "hyp-*.yaml", _upsert_hypothesis)
+    ev = _sync_table(conn, "evidence", EVIDENCE_DIR, "ev-*.yaml", _upsert_evidence)
+    return {"hypotheses": hyp, "evidence": ev}
+
+
+def _write_yaml(path, data):
+    """Write the YAML export atomically and return its (mtime_ns, size)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w") as f:
+        yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    os.replace(tmp, path)
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def save_hypothesis(conn, data, path=None):
+    """Write a hypothesis to its YAML file and the index together, under its lock."""
+    path = path or HYPOTHESES_DIR / f"{data['id']}.yaml"
+    with file_lock(data["id"]):
+        _upsert_hypothesis(conn, path, data, _write_yaml(path, data))
+
+
+def save_evidence(conn, data, path=None):
+    """Write an evidence record to its YAML file and the index together."""
+    path = path or EVIDENCE_DIR / f"{data['id']}.yaml"
+    _upsert_evidence(conn, path, data, _write_yaml(path, data))
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def status_counts(conn):
+    rows = conn.execute("SELECT status, COUNT(*) AS n FROM hypotheses GROUP BY status")
+    return {row["status"]: row["n"] for row in rows}
+
+
+def hypotheses_by_status(conn, status, limit=None):
+    sql = "SELECT id, domain, confidence FROM hypotheses WHERE status = ? ORDER BY confidence DESC"
+    params = [status]
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return [dict(row) for row in conn.execute(sql, params)]
+
+
+def hypotheses_by_domain(conn, domain):
+    rows = conn.execute(
+        "SELECT id, status, confidence FROM hypotheses WHERE domain = ? ORDER BY confidence DESC",
+        (domain,),
+    )
+    return [dict(row) for row in rows]
+
+
+def next_hypothesis(conn):
+    """Highest-confidence active hypothesis, or None."""
+    rows = hypotheses_by_status(conn, "active", limit=1)
+    return rows[0] if rows else None
+
+
+def load_hypothesis(conn, hyp_id):
+    row = conn.execute("SELECT doc FROM hypotheses WHERE id = ?", (hyp_id,)).fetchone()
+    return json.loads(row["doc"]) if row else None
+
+
+def bearings_for(conn, hyp_id):
+    rows = conn.execute(
+        """SELECT b.evidence_id, b.direction, b.weight, e.recorded_at
+           FROM bearings b JOIN evidence e ON e.id = b.evidence_id
+           WHERE b.hypothesis_id = ?
+           ORDER BY e.recorded_at, b.evidence_id""",
+        (hyp_id,),
+    )
+    return [dict(row) for row in rows]
+
+
+def performed_tests(conn):
+    """Set of (hypothesis_id, suggested test index) already run."""
+    return {(row["hypothesis_id"], row["test_index"])
+            for row in conn.execute("SELECT hypothesis_id, test_index FROM performed_tests")}
+
+
+def evidence_count(conn, hyp_id):
+    row = conn.execute(
+        "SELECT COUNT(DISTINCT evidence_id) AS n FROM bearings WHERE hypothesis_id = ?", (hyp_id,)
+    ).fetchone()
+    return row["n"]
+
+
+# ---------------------------------------------------------------------------
+# Migration check (called by eliminate_init.py)
+# ---------------------------------------------------------------------------
+
+def check_migration(path=STORE_FILE):
+    """
+    Report whether the active session's store is usable.
+
+    Returns (state, message) where state is one of:
+      "none"         - no active YAML files and no store
+      "not_imported" - YAML files exist but no store; the store is opt-in,
+                       so this is not an error (run --import to opt in)
+      "outdated"     - store schema is older than this script
+      "stale"        - YAML files changed since the last sync
+      "ok"           - store matches the YAML export
+    """
+    yaml_files = {**_scan(HYPOTHESES_DIR, "hyp-*.yaml"), **_scan(EVIDENCE_DIR, "ev-*.yaml")}
+    if not store_exists(path):
+        if yaml_files:
+            return "not_imported", f"{len(yaml_files)} session files not indexed (run --import)"
+        return "none", "No active session"
+
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    try:
+        tables = {r["name"] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if "meta" not in tables or schema_version(conn) < SCHEMA_VERSION:
+            return "outdated", "Store schema is out of date (run --import to rebuild)"
+        indexed = {}
+        for table in ("hypotheses", "evidence"):
+            for row in conn.execute(f"SELECT path, mtime_ns, size FROM {table}"):
+                indexed[row["path"]] = (row["mtime_ns"], row["size"])
+    finally:
+        conn.close()
+
+    drift = sum(1 for p, stat in yaml_files.items() if indexed.get(p) != stat)
+    drift += sum(1 for p in indexed if p not in yaml_files)
+    if drift:
+        return "stale", f"{drift} file(s) changed since last sync (run --sync)"
+    return "ok", f"Store in sync ({len(yaml_files)} files)"
+
+
+def import_session(path=STORE_FILE):
+    """Build the store from scratch from the active YAML files."""
+    if store_exists(path):
+        Path(path).unlink()
+    with open_store(path) as conn:
+        return sync_from_yaml(conn)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def print_status(conn):
+    counts = status_counts(conn)
+    total = sum(counts.values())
+    print(f"Hypotheses: {total}")
+    for status in ("active", "unlikely", "eliminated", "confirmed", "verified"):
+        if counts.get(status):
+            print(f"  {status}: {counts[status]}")
+    leaders = hypotheses_by_status(conn, "active", limit=2)
+    if leaders:
+        print(f"\nLeading: {leaders[0]['id']} ({leaders[0]['confidence']:.2f})")
+        if len(leaders) > 1:
+            print(f"Separation: {leaders[0]['confidence'] - leaders[1]['confidence']:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Indexed store for the active elimination session")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--import", dest="do_import", action="store_true", help="Import active YAML files")
+    group.add_argument("--sync", action="store_true", help="Re-index changed YAML files")
+    group.add_argument("--check", action="store_true", help="Check whether the store needs migrating")
+    group.add_argument("--status", action="store_true", help="Show indexed status summary")
+    group.add_argument("--next", action="store_true", help="Show next hypothesis to investigate")
+    args = parser.parse_args()
+
+    if args.check:
+        state, message = check_migration()
+        print(f"{state}: {message}")
+        return 1 if state in ("outdated", "stale") else 0
+
+    if args.do_import:
+        stats = import_session()
+        print(f"Imported {stats['hypotheses'][0]} hypotheses, {stats['evidence'][0]} evidence records")
+        return 0
+
+    if not store_exists():
+        print("No session store found. Run with --import first.")
+        return 1
+
+    with open_store() as conn:
+        if args.sync:
+            stats = sync_from_yaml(conn)
+            print(f"Re-indexed {stats['hypotheses'][0]} hypotheses, {stats['evidence'][0]} evidence records")
+        elif args.status:
+            sync_from_yaml(conn)
+            print_status(conn)
+        elif args.next:
+            sync_from_yaml(conn)
+            nxt = next_hypothesis(conn)
+            if not nxt:
+                print("No active hypotheses")
+                return 1
+            print(f"{nxt['id']} ({nxt['domain']}, confidence {nxt['confidence']:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+"""
+benchmark.py - Benchmark and load test for the elimination and update hot paths
+
+Builds synthetic adopted projects from test-projects/minimal-* plus template/,
+filled with generated hypotheses, evidence, archived sessions, heuristics and
+.serena memories, then times the hot paths at each size:
+
+  - elimination scripts (eliminate_next/status/archive.py),
+    run as subprocesses when present in .claude/scripts/elimination/
+  - batch update, indexed store, scheduler, heuristic matcher, log and
+    archive reader, called in-process
+  - manifest checksum refresh and /claude-learns.update conflict detection
+    against original_checksums
+
+Each case reports p50/p95 latency and tracemalloc peak; the slowest
+functions under cProfile are listed per case. Results can be saved as a
+baseline JSON and later runs compared against it to flag regressions.
+
+Usage:
+    python3 scripts/benchmark.py                          # small + medium
+    python3 scripts/benchmark.py --sizes small,medium,large --repeat 10
+    python3 scripts/benchmark.py --save-baseline /tmp/baseline.json
+    python3 scripts/benchmark.py --compare /tmp/baseline.json --threshold 1.25
+"""
+
+import argparse
+import cProfile
+import json
+import os
+import platform
+import pstats
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = REPO_ROOT / ".claude" / "scripts" / "elimination"
+TEMPLATE_DIR = REPO_ROOT / "template"
+TEST_PROJECTS = REPO_ROOT / "test-projects"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import eliminate_batch  # noqa: E402
+import eliminate_compact  # noqa: E402
+import eliminate_heuristics  # noqa: E402
+import eliminate_log  # noqa: E402
+import eliminate_schedule  # noqa: E402
+import eliminate_store  # noqa: E402
+import manifest_hashes  # noqa: E402
+
+SIZES = {
+    "small": {"hypotheses": 10, "evidence": 20, "sessions": 10, "heuristics": 5, "memories": 6},
+    "medium": {"hypotheses": 100, "evidence": 200, "sessions": 100, "heuristics": 50, "memories": 50},
+    "large": {"hypotheses": 1000, "evidence": 2000, "sessions": 500, "heuristics": 500, "memories": 200},
+}
+
+DOMAINS = ("code", "config", "dependencies", "data", "infrastructure", "concurrency")
+TAGS = ("api-timeout", "concurrency", "performance", "memory", "deploy", "database", "auth", "cache")
+
+# Subprocess cases: script name -> arguments. eliminate_init and
+# eliminate_checkpoint need session-specific arguments; add them here
+# together with those scripts.
+SCRIPT_CASES = {
+    "eliminate_next": [],
+    "eliminate_status": [],
+    "eliminate_archive": ["--dry-run"],
+}
+
+# A regression must also exceed this absolute slowdown to be flagged
+MIN_REGRESSION_MS = 1.0
+
+
+@contextmanager
+def working_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def dump(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic projects
+# ---------------------------------------------------------------------------
+
+def hypothesis_doc(rng, index):
+    confidence = round(rng.uniform(0.05, 0.9), 2)
+    return {
+        "id": f"hyp-{index:03d}",
+        "description": f"Synthetic hypothesis {index}",
+        "domain": rng.choice(DOMAINS),
+        "source": "generated",
+        "status": "active" if confidence >= 0.25 else "unlikely",
+        "confidence": {
+            "initial": confidence,
+            "current": confidence,
+            "history": [{"timestamp": "2026-01-01T00:00:00Z", "value": confidence, "reason": "Initial"}],
+            "trend": "stable",
+        },
+        "evidence": {"supporting": [], "contradicting": [], "neutral": []},
+        "suggested_tests": [
+            {
+                "description": f"Test {t} for hypothesis {index}",
+                "expected_if_true": "Symptom reproduces",
+                "expected_if_false": "Symptom absent",
+                "priority": rng.choice(["high", "medium", "low"]),
+            }
+            for t in range(2)
+        ],
+        "metadata": {
+            "created_at": "2026-01-01T00:00:00Z",
+            "context_tags": rng.sample(TAGS, 2),
+            "heuristic_matched": f"heur-{rng.randint(1, 5):03d}",
+        },
+    }
+
+
+def evidence_doc(rng, index, n_hypotheses):
+    targets = rng.sample(range(1, n_hypotheses + 1), min(3, n_hypotheses))
+    return {
+        "id": f"ev-{index:03d}",
+        "type": "test_result",
+        "description": f"Synthetic evidence {index}",
+        "test_performed": {
+            "description": f"Synthetic test {index}",
+            "suggested_test": {"hypothesis_id": f"hyp-{targets[0]:03d}", "index": rng.randint(0, 1)},
+        },
+        "bearing": [
+            {
+                "hypothesis_id": f"hyp-{t:03d}",
+                "direction": rng.choice(["supports", "contradicts", "neutral"]),
+                "weight": round(rng.uniform(0.1, 1.0), 2),
+            }
+            for t in targets
+        ],
+        "metadata": {"recorded_at": f"2026-01-01T00:{index // 60 % 60:02d}:{index % 60:02d}Z", "iteration": index},
+    }
+
+
+def heuristic_doc(rng, index):
+    words = ["timeout", "error", "load", "memory", "deploy", "config", "pool", "latency", "crash", "cache"]
+    return {
+        "id": f"heur-{index:03d}",
+        "name": f"synthetic_{index}",
+        "trigger_conditions": [{"condition": " ".join(rng.sample(words, 4))} for _ in range(3)],
+        "context_tags": rng.sample(TAGS, 2),
+        "hypothesis_template": {"domain": rng.choice(DOMAINS), "initial_confidence": round(rng.uniform(0.4, 0.8), 2)},
+        "statistics": {"times_triggered": rng.randint(0, 10), "successful_predictions": 0,
+                       "success_rate": round(rng.random(), 2), "last_updated": None},
+    }
+
+
+def build_project(root, size, project="minimal-py", seed=0):
+    """Create a synthetic adopted project under root and return its path."""
+    rng = random.Random(seed)
+    counts = SIZES[size]
+    target = Path(root) / f"{project}-{size}"
+    shutil.copytree(TEST_PROJECTS / project, target)
+    for name in (".elimination", ".specify", ".serena"):
+        if (TEMPLATE_DIR / name).exists():
+            shutil.copytree(TEMPLATE_DIR / name, target / name, dirs_exist_ok=True)
+    shutil.copy(REPO_ROOT / "manifest.yaml", target / "manifest.yaml")
+    if SCRIPTS_DIR.exists():
+        shutil.copytree(SCRIPTS_DIR, target / ".claude" / "scripts" / "elimination",
+                        ignore=shutil.ignore_patterns("__pycache__"))
+
+    # Installed copies of every manifest-listed file, some locally modified
+    lines = (target / "manifest.yaml").read_text().splitlines()
+    for _, rel, _ in manifest_hashes.manifest_checksums(lines):
+        path = target / rel
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Placeholder for files missing from this checkout
+            path.write_text(f"# {rel}\n" + "synthetic content\n" * 200)
+        if rng.random() < 0.1:
+            with open(path, "a") as f:
+                f.write("# local edit\n")
+
+    active = target / ".elimination" / "active"
+    for i in range(1, counts["hypotheses"] + 1):
+        dump(active / "hypotheses" / f"hyp-{i:03d}.yaml", hypothesis_doc(rng, i))
+    for i in range(1, counts["evidence"] + 1):
+        dump(active / "evidence" / f"ev-{i:03d}.yaml", evidence_doc(rng, i, counts["hypotheses"]))
+
+    dump(target / ".elimination" / "learned" / "heuristics.yaml",
+         {"heuristics": [heuristic_doc(rng, i) for i in range(1, counts["heuristics"] + 1)]})
+
+    archive = target / ".elimination" / "archive"
+    for s in range(counts["sessions"]):
+        month = f"2025-{s % 12 + 1:02d}"
+        session_dir = archive / month / f"session-{month}-{s:03d}"
+        dump(session_dir / "session.yaml", {"session": {
+            "id": f"session-{month}-{s:03d}",
+            "problem_description": f"Synthetic problem {s}",
+            "status": rng.choice(["resolved", "abandoned"]),
+            "trigger": {"matched_heuristics": [f"heur-{rng.randint(1, 5):03d}: synthetic"]},
+        }})
+        for h in range(1, 6):
+            doc = hypothesis_doc(rng, h)
+            doc["status"] = "confirmed" if h == 1 else "eliminated"
+            dump(session_dir / "hypotheses" / f"hyp-{h:03d}.yaml", doc)
+        for e in range(1, 7):
+            dump(session_dir / "evidence" / f"ev-{e:03d}.yaml", evidence_doc(rng, e, 5))
+
+    memories = target / ".serena" / "memories"
+    for m in range(counts["memories"]):
+        (memories / f"synthetic-{m:03d}.md").write_text(f"# Memory {m}\n\n" + "- learned item\n" * 50)
+    return target
+
+
+# ---------------------------------------------------------------------------
+# Hot paths
+# ---------------------------------------------------------------------------
+
+def detect_update_conflicts(project, manifest):
+    """
+    Classify installed files the way /claude-learns.update does.
+
+    unchanged: local == latest; update: local == original != latest;
+    conflict: local differs from both; missing: not installed.
+    """
+    lines = Path(manifest).read_text().splitlines()
+    latest, original = {}, {}
+    for i, rel, digest in manifest_hashes.manifest_checksums(lines):
+        (original if manifest_hashes.ORIGINAL_RE.match(lines[i]) else latest)[rel] = digest
+    result = {"unchanged": 0, "update": 0, "conflict": 0, "missing": 0}
+    for rel, orig in original.items():
+        path = Path(project) / rel
+        if not path.exists():
+            result["missing"] += 1
+            continue
+        local = manifest_hashes.sha256_file(path)
+        if local == latest.get(rel, orig):
+            result["unchanged"] += 1
+        elif local == orig:
+            result["update"] += 1
+        else:
+            result["conflict"] += 1
+    return result
+
+
+def script_case(name, args):
+    if not (SCRIPTS_DIR / f"{name}.py").exists():
+        return None
+    script = Path(".claude/scripts/elimination") / f"{name}.py"
+
+    def run():
+        completed = subprocess.run([sys.executable, str(script), *args], capture_output=True, text=True)
+        if completed.returncode != 0:
+            detail = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "no stderr"
+            raise RuntimeError(f"exit {completed.returncode}: {detail}")
+    return run
+
+
+def python_cases(project, tmp):
+    """Return {case name: callable}; callables run with cwd = project."""
+    params = eliminate_batch.load_params()
+    cache_dir = Path(tmp) / "caches"
+    cache_dir.mkdir(exist_ok=True)
+    eliminate_store.import_session()
+    eliminate_heuristics.load_index(rebuild=True)
+
+    def batch_replay():
+        hyps = {k: v for k, (_, v) in eliminate_batch.load_yaml_dir(eliminate_batch.HYPOTHESES_DIR, "hyp-*.yaml").items()}
+        records = [v for _, v in eliminate_batch.load_yaml_dir(eliminate_batch.EVIDENCE_DIR, "ev-*.yaml").values()]
+        eliminate_batch.apply_evidence(hyps, sorted(records, key=eliminate_batch.evidence_sort_key), params, replay=True)
+
+    def yaml_status_scan():
+        hyps = eliminate_batch.load_yaml_dir(eliminate_batch.HYPOTHESES_DIR, "hyp-*.yaml")
+        max((h for _, h in hyps.values() if h.get("status") == "active"),
+            key=lambda h: h["confidence"]["current"], default=None)
+
+    def store_status_next():
+        with eliminate_store.open_store() as conn:
+            eliminate_store.sync_from_yaml(conn)
+            eliminate_store.status_counts(conn)
+            eliminate_store.next_hypothesis(conn)
+
+    convergence = eliminate_schedule.load_convergence()
+
+    def schedule_plan():
+        # One loop iteration: cache loaded from disk, session read, plan, cache saved
+        cache = eliminate_schedule.ScoreCache(cache_dir / "schedule.json")
+        hypotheses, performed = eliminate_schedule.load_session(cache)
+        eliminate_schedule.plan(hypotheses, convergence, performed, top=5, cache=cache)
+        cache.save()
+
+    def heuristic_match():
+        index = eliminate_heuristics.load_index()
+        eliminate_heuristics.match(index, "timeout errors under load after deploy", ["api-timeout"])
+
+    def log_append_and_stream():
+        # Fresh segments each call so timings do not grow with --repeat
+        log_dir = Path(tempfile.mkdtemp(dir=cache_dir))
+        with eliminate_log.LogWriter(directory=log_dir, fsync="never") as writer:
+            for i in range(50):
+                writer.append({"hypothesis_id": f"hyp-{i:03d}", "action": "soft_eliminate",
+                               "outcome": {"previous_confidence": 0.3, "new_confidence": 0.2}})
+        sum(1 for _ in eliminate_log.iter_entries(log_dir, action="soft_eliminate"))
+
+    def archive_stats():
+        eliminate_compact.heuristic_stats()
+
+    manifest_copy = cache_dir / "manifest.yaml"
+    shutil.copy("manifest.yaml", manifest_copy)
+    manifest_cache = cache_dir / "manifest-cache.json"
+
+    def manifest_refresh():
+        manifest_hashes.refresh(manifest_copy, Path.cwd(), cache=manifest_hashes.HashCache(manifest_cache))
+
+    def update_conflicts():
+        detect_update_conflicts(Path.cwd(), "manifest.yaml")
+
+    return {
+        "batch_replay": batch_replay,
+        "yaml_status_scan": yaml_status_scan,
+        "store_status_next": store_status_next,
+        "schedule_plan": schedule_plan,
+        "heuristic_match": heuristic_match,
+        "log_append_stream": log_append_and_stream,
+        "archive_stats_loose": archive_stats,
+        "manifest_refresh": manifest_refresh,
+        "update_conflicts": update_conflicts,
+    }
+
+
+def measure(fn, repeat):
+    """Time fn `repeat` times (after one warm-up) and record its memory peak."""
+    fn()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    timings.sort()
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[min(len(timings) - 1, int(round(0.95 * (len(timings) - 1))))], 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def hot_spots(fn, limit=3):
+    """Top functions by cumulative time, excluding the benchmark wrapper."""
+    profiler = cProfile.Profile()
+    profiler.runcall(fn)
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, func), (_, _, _, cumtime, _) in stats.stats.items():
+        if filename == __file__ or filename.startswith("~") or func.startswith("<"):
+            continue
+        rows.append((cumtime, f"{Path(filename).name}:{line}({func})"))
+    rows.sort(reverse=True)
+    return [f"{name} {cum * 1000:.1f}ms" for cum, name in rows[:limit]]
+
+
+def run_size(size, repeat, project, profile):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        target = build_project(tmp, size, project)
+        with working_directory(target):
+            for name, args in SCRIPT_CASES.items():
+                fn = script_case(name, args)
+                if fn is None:
+                    results[name] = {"skipped": "script not installed"}
+                    continue
+                try:
+                    results[name] = measure(fn, repeat)
+                except RuntimeError as e:
+                    results[name] = {"skipped": f"failed: {e}"}
+
+            cases = python_cases(target, tmp)
+            for name, fn in cases.items():
+                results[name] = measure(fn, repeat)
+                if profile:
+                    results[name]["hot_spots"] = hot_spots(fn)
+
+            eliminate_compact.compact(older_than_days=0)
+            results["archive_stats_compacted"] = measure(cases["archive_stats_loose"], repeat)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Baselines
+# ---------------------------------------------------------------------------
+
+def compare(results, baseline, threshold):
+    """Return regressions where p50 grew by more than threshold x."""
+    regressions = []
+    for size, cases in results.items():
+        for name, current in cases.items():
+            previous = (baseline.get("results", {}).get(size) or {}).get(name)
+            if not previous or "p50_ms" not in current or "p50_ms" not in previous:
+                continue
+            ratio = current["p50_ms"] / previous["p50_ms"] if previous["p50_ms"] else float("inf")
+            if ratio > threshold and current["p50_ms"] - previous["p50_ms"] > MIN_REGRESSION_MS:
+                regressions.append(f"{size}/{name}: {previous['p50_ms']:.2f} -> {current['p50_ms']:.2f} ms "
+                                   f"({ratio:.2f}x)")
+    return regressions
+
+
+def print_results(results):
+    print(f"{'size':<7} {'case':<26} {'p50 ms':>9} {'p95 ms':>9} {'peak KiB':>9}")
+    for size, cases in results.items():
+        for name, r in cases.items():
+            if "skipped" in r:
+                print(f"{size:<7} {name:<26} {'-':>9} {'-':>9} {'-':>9}  ({r['skipped']})")
+                continue
+            print(f"{size:<7} {name:<26} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['peak_kib']:>9.1f}")
+    spots = [(size, name, r["hot_spots"]) for size, cases in results.items()
+             for name, r in cases.items() if r.get("hot_spots")]
+    if spots:
+        print("\nHot spots (cumulative):")
+        for size, name, rows in spots:
+            print(f"  {size}/{name}: " + "; ".join(rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark elimination and update hot paths")
+    parser.add_argument("--sizes", default="small,medium", help=f"Comma list of {', '.join(SIZES)}")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case")
+    parser.add_argument("--project", default="minimal-py", help="test-projects skeleton to adopt")
+    parser.add_argument("--no-profile", action="store_true", help="Skip cProfile hot spots")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write results as a baseline JSON")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a baseline JSON")
+    parser.add_argument("--threshold", type=float, default=1.25, help="p50 slowdown ratio that counts as a regression")
+    args = parser.parse_args()
+
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        print(f"Unknown size(s): {', '.join(unknown)}")
+        return 1
+
+    results = {size: run_size(size, args.repeat, args.project, not args.no_profile) for size in sizes}
+    print_results(results)
+
+    if args.save_baseline:
+        baseline = {
+            "meta": {
+                "created": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "repeat": args.repeat,
+                "project": args.project,
+                "commit": subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                         capture_output=True, text=True).stdout.strip() or None,
+            },
+            "results": results,
+        }
+        path = Path(args.save_baseline)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"\nBaseline saved to {path}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold}x:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions over {args.threshold}x against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
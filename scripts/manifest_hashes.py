@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+manifest_hashes.py - Incremental checksum refresh and check for manifest.yaml
+
+Recomputes the sha256 of every template file listed in manifest.yaml
+(always_update, updateable, merge_only and original_checksums) and rewrites
+only the checksum values, leaving the manifest's layout and comments alone.
+
+A stat cache (path -> size, mtime_ns, inode, digest) in
+scripts/.manifest-cache.json means only files that changed since the last
+run are re-hashed. Hashing runs on a thread pool and large files are read
+through mmap. The manifest is written atomically and only when something
+changed.
+
+Adding new files to a category is still done with
+.claude/scripts/generate-manifest.py; this script reports template files that
+match the synced patterns but are not listed, and listed files that are
+missing, and then exits with status 2 so callers do not treat the manifest
+as complete.
+
+Usage:
+    # Refresh checksums in manifest.yaml from template/
+    python3 scripts/manifest_hashes.py --version 1.2
+
+    # After a sync: skip the template walk for unlisted files, checking only
+    # the files the sync report lists (every listed checksum is still verified)
+    python3 scripts/manifest_hashes.py --version 1.2 --changed-from sync-report.json
+
+    # Verify template/ against manifest.yaml without writing anything
+    python3 scripts/manifest_hashes.py --check
+"""
+
+import argparse
+import fnmatch
+import glob
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TEMPLATE_DIR = REPO_ROOT / "template"
+MANIFEST = REPO_ROOT / "manifest.yaml"
+CACHE_FILE = REPO_ROOT / "scripts" / ".manifest-cache.json"
+
+MMAP_THRESHOLD = 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Category A: files sync_template.py copies into template/ (keep in step
+# with DEVELOPMENT.md). Any match not listed in the manifest is reported.
+SYNC_PATTERNS = (
+    ".claude/commands/*.md",
+    ".claude/scripts/elimination/*.py",
+    ".claude/skills/*/SKILL.md",
+    ".claude/aliases.yaml",
+    ".claude/update-registry.yaml",
+    ".elimination/config.yaml",
+    ".specify/config.yaml",
+)
+
+LIST_PATH_RE = re.compile(r'^\s*- path: "([^"]+)"\s*$')
+LIST_CHECKSUM_RE = re.compile(r'^(\s*checksum: ")sha256:([0-9a-f]*)("\s*)$')
+ORIGINAL_RE = re.compile(r'^(\s*"([^"]+)": ")sha256:([0-9a-f]*)("\s*)$')
+
+
+def sha256_file(path):
+    """sha256 of a file, via mmap for large files."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        else:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class HashCache:
+    """Digests keyed by template-relative path, valid while (size, mtime_ns, inode) match."""
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = Path(path)
+        self.entries = {}
+        self.dirty = False
+        self.stale_count = 0
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def digests(self, root, paths, workers=WORKERS):
+        """Map each existing path under root to its sha256, hashing only stale entries."""
+        result, stale = {}, []
+        root = str(root)
+        for key in paths:
+            try:
+                st = os.stat(os.path.join(root, key))
+            except FileNotFoundError:
+                self.entries.pop(key, None)
+                continue
+            stamp = [st.st_size, st.st_mtime_ns, st.st_ino]
+            cached = self.entries.get(key)
+            if cached and cached[:3] == stamp:
+                result[key] = cached[3]
+            else:
+                stale.append((key, stamp))
+
+        if stale:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                hashed = pool.map(lambda item: sha256_file(os.path.join(root, item[0])), stale)
+                for (key, stamp), digest in zip(stale, hashed):
+                    self.entries[key] = stamp + [digest]
+                    result[key] = digest
+            self.dirty = True
+        self.stale_count = len(stale)
+        return result
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.entries))
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+def manifest_checksums(lines):
+    """Yield (line_index, path, digest) for every checksum in the manifest."""
+    current_path = None
+    for i, line in enumerate(lines):
+        match = LIST_PATH_RE.match(line)
+        if match:
+            current_path = match.group(1)
+            continue
+        match = LIST_CHECKSUM_RE.match(line)
+        if match and current_path:
+            yield i, current_path, match.group(2)
+            current_path = None
+            continue
+        match = ORIGINAL_RE.match(line)
+        if match:
+            yield i, match.group(2), match.group(3)
+
+
+def unlisted_files(listed, template_dir=TEMPLATE_DIR):
+    found = set()
+    for pattern in SYNC_PATTERNS:
+        found.update(glob.glob(pattern, root_dir=template_dir))
+    return sorted(found - set(listed))
+
+
+def unlisted_changed(listed, changed):
+    """Unlisted files among a sync report's paths, without walking template/."""
+    return sorted(
+        path for path in set(changed) - set(listed)
+        if any(fnmatch.fnmatch(path, pattern) for pattern in SYNC_PATTERNS)
+    )
+
+
+def compute(lines, cache, template_dir=TEMPLATE_DIR):
+    """Return (entries, digests): manifest checksum entries and current digests."""
+    entries = list(manifest_checksums(lines))
+    return entries, cache.digests(template_dir, {path for _, path, _ in entries})
+
+
+def check(manifest=MANIFEST, template_dir=TEMPLATE_DIR, cache=None):
+    """
+    Compare template/ against the manifest; return a list of problems.
+
+    Writes nothing: the stat cache is read but not saved.
+    """
+    cache = cache or HashCache()
+    lines = Path(manifest).read_text().splitlines(keepends=True)
+    entries, digests = compute(lines, cache, template_dir)
+    problems = []
+    for _, path, expected in entries:
+        actual = digests.get(path)
+        if actual is None:
+            problems.append(f"missing: {path}")
+        elif actual != expected:
+            problems.append(f"changed: {path}")
+    for path in unlisted_files({p for _, p, _ in entries}, template_dir):
+        problems.append(f"unlisted: {path}")
+    return sorted(set(problems))
+
+
+def refresh(manifest=MANIFEST, template_dir=TEMPLATE_DIR, version=None, cache=None, changed=None):
+    """
+    Rewrite stale checksums in the manifest atomically.
+
+    Every listed file is stat'ed (and re-hashed if its stat changed), so
+    edits made outside a sync are always picked up. `changed`, the paths a
+    sync report lists, only replaces the template walk for unlisted files.
+
+    Returns (updated, missing, unlisted) path lists. The file is untouched
+    when nothing changed.
+    """
+    cache = cache or HashCache()
+    manifest = Path(manifest)
+    lines = manifest.read_text().splitlines(keepends=True)
+    entries, digests = compute(lines, cache, template_dir)
+
+    updated, missing = set(), set()
+    for i, path, expected in entries:
+        actual = digests.get(path)
+        if actual is None:
+            missing.add(path)
+        elif actual != expected:
+            lines[i] = lines[i].replace(f"sha256:{expected}", f"sha256:{actual}")
+            updated.add(path)
+
+    version_changed = False
+    if version:
+        for i, line in enumerate(lines):
+            if line.startswith("version:") and line.strip() != f'version: "{version}"':
+                lines[i] = f'version: "{version}"\n'
+                version_changed = True
+
+    if updated or version_changed:
+        today = date.today().isoformat()
+        for i, line in enumerate(lines):
+            if line.startswith("generated:"):
+                lines[i] = f'generated: "{today}"\n'
+            elif line.startswith("# Generated:"):
+                lines[i] = f"# Generated: {today}\n"
+        tmp = manifest.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, manifest)
+
+    cache.save()
+    listed = {p for _, p, _ in entries}
+    if changed is None:
+        unlisted = unlisted_files(listed, template_dir)
+    else:
+        unlisted = unlisted_changed(listed, changed)
+    return sorted(updated), sorted(missing), unlisted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh or check manifest.yaml checksums")
+    parser.add_argument("--check", action="store_true", help="Verify template/ against the manifest")
+    parser.add_argument("--version", help="Set the manifest version")
+    parser.add_argument("--manifest", default=str(MANIFEST), help="Manifest to refresh or check")
+    parser.add_argument("--changed-from", metavar="REPORT", help="sync_template.py report of changed files")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.check:
+        problems = check(args.manifest)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for problem in problems:
+            print(problem)
+        print(f"{'OK' if not problems else f'{len(problems)} problem(s)'} ({elapsed_ms:.0f} ms)")
+        return 1 if problems else 0
+
+    changed = None
+    if args.changed_from:
+        with open(args.changed_from) as f:
+            changed = set(json.load(f).get("synced") or [])
+
+    cache = HashCache()
+    updated, missing, unlisted = refresh(args.manifest, version=args.version, cache=cache, changed=changed)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    for path in updated:
+        print(f"updated: {path}")
+    for path in missing:
+        print(f"missing: {path}")
+    for path in unlisted:
+        print(f"unlisted: {path} (add with .claude/scripts/generate-manifest.py)")
+    print(f"{len(updated)} checksum(s) updated, {cache.stale_count} file(s) re-hashed ({elapsed_ms:.0f} ms)")
+    return 2 if missing or unlisted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -71,97 +71,45 @@ check_preconditions() {
   fi
 }
 
-# Violation checks
-check_violations() {
-  local violations=0
-
-  # Check for dev-specific content in root files
-  if grep -rq "danielcbright\|/root/claudebot" .claude/commands/ .claude/scripts/ 2>/dev/null; then
-    warn "Found dev-specific paths in command/script files"
-    violations=$((violations + 1))
-  fi
+# Sync + violation checks (single pass, see scripts/sync_template.py)
+REPORT_FILE=""
 
-  # Check template files still have placeholders
-  if [[ -f "template/CLAUDE.md" ]]; then
-    if ! grep -q "\[PROJECT_NAME\]" template/CLAUDE.md; then
-      warn "template/CLAUDE.md missing [PROJECT_NAME] placeholder"
-      violations=$((violations + 1))
-    fi
-  fi
-
-  # Check for unexpected files in template active directories
-  local unexpected_files
-  unexpected_files=$(find template/.elimination/active template/.elimination/archive \
-                          -type f ! -name '.gitkeep' 2>/dev/null | wc -l)
-  if [[ $unexpected_files -gt 0 ]]; then
-    warn "Found $unexpected_files unexpected files in template/.elimination/active or archive"
-    violations=$((violations + 1))
-  fi
+sync_files() {
+  local args=(--report "$REPORT_FILE")
+  if [[ $DRY_RUN -eq 1 ]]; then args+=(--dry-run); fi
+  if [[ $FORCE -eq 1 ]]; then args+=(--force); fi
 
-  if [[ $violations -gt 0 ]] && [[ $FORCE -eq 0 ]]; then
-    echo ""
-    error "Found $violations violation(s). Use --force to proceed anyway."
+  if ! python3 scripts/sync_template.py "${args[@]}"; then
     exit 1
-  elif [[ $violations -gt 0 ]]; then
-    warn "Proceeding with $violations violation(s) due to --force"
   fi
-
-  return 0
-}
-
-# Sync function
-sync_files() {
-  local file_count=0
-
-  # Enable nullglob so patterns that don't match expand to nothing
-  shopt -s nullglob
-
-  # Category A: Direct sync (safe)
-  local patterns=(
-    ".claude/commands/*.md"
-    ".claude/scripts/elimination/*.py"
-    ".claude/skills/*/SKILL.md"
-    ".claude/aliases.yaml"
-    ".claude/update-registry.yaml"
-    ".elimination/config.yaml"
-    ".specify/config.yaml"
-  )
-
-  for pattern in "${patterns[@]}"; do
-    for file in $pattern; do
-      if [[ ! -f "$file" ]]; then continue; fi
-
-      local target="template/$file"
-      local action="Sync"
-
-      if [[ $DRY_RUN -eq 1 ]]; then
-        echo "[DRY-RUN] Would sync: $file -> $target"
-        file_count=$((file_count + 1))
-      else
-        mkdir -p "$(dirname "$target")"
-        cp "$file" "$target"
-        info "Synced: $file"
-        file_count=$((file_count + 1))
-      fi
-    done
-  done
-
-  echo ""
-  info "Synced $file_count files"
 }
 
 # Manifest regeneration
 regenerate_manifest() {
   if [[ $DRY_RUN -eq 1 ]]; then
     echo ""
-    echo "[DRY-RUN] Would regenerate manifest with version 1.2"
+    echo "[DRY-RUN] Would refresh manifest checksums with version 1.2"
     return
   fi
 
   echo ""
-  info "Regenerating manifest..."
-  if python3 .claude/scripts/generate-manifest.py --version 1.2 2>&1; then
+  info "Refreshing manifest checksums..."
+  # Every listed checksum is re-verified through the stat cache; the sync
+  # report only replaces the walk for unlisted files. Exit status 2 means
+  # files are unlisted or missing, which needs the full generator.
+  local status=0
+  python3 scripts/manifest_hashes.py --version 1.2 --changed-from "$REPORT_FILE" 2>&1 || status=$?
+  if [[ $status -eq 2 && -f .claude/scripts/generate-manifest.py ]]; then
+    info "Manifest file lists changed; regenerating..."
+    status=0
+    python3 .claude/scripts/generate-manifest.py --version 1.2 2>&1 || status=$?
+  fi
+
+  if [[ $status -eq 0 ]]; then
     info "Manifest updated"
+  elif [[ $status -eq 2 ]]; then
+    error "Manifest is missing files or lists deleted ones; update it with .claude/scripts/generate-manifest.py"
+    exit 1
   else
     error "Manifest generation failed"
     exit 1
@@ -189,9 +137,8 @@ main() {
 
   check_preconditions
 
-  if [[ $FORCE -eq 0 ]]; then
-    check_violations
-  fi
+  REPORT_FILE="$(mktemp -t sync-report.XXXXXX)"
+  trap 'rm -f "$REPORT_FILE"' EXIT
 
   sync_files
   regenerate_manifest
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+sync_template.py - Single-pass sync engine behind sync-to-template.sh
+
+Walks the development sources once and, in the same pass:
+  - checks command/script files for dev-specific paths
+  - compares each synced file with its template/ copy by sha256
+  - copies only files that changed (copy_file_range when available)
+and checks template/CLAUDE.md placeholders and the template's
+active/archive directories.
+
+The result is a JSON change report that manifest_hashes.py can consume
+(--changed-from) instead of re-scanning template/.
+
+Usage:
+    python3 scripts/sync_template.py [--dry-run] [--force] [--report PATH]
+
+Exit status is 1 when violations are found without --force.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+from manifest_hashes import SYNC_PATTERNS, HashCache
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TEMPLATE_DIR = REPO_ROOT / "template"
+
+# Directories scanned for dev-specific content
+DEV_PATH_DIRS = (".claude/commands", ".claude/scripts")
+DEV_PATH_RE = re.compile(rb"danielcbright|/root/claudebot")
+
+# Template directories that must only hold .gitkeep files
+USER_DATA_DIRS = (".elimination/active", ".elimination/archive")
+
+RED = "\033[0;31m"
+GREEN = "\033[0;32m"
+YELLOW = "\033[1;33m"
+NC = "\033[0m"
+
+
+def warn(message):
+    print(f"{YELLOW}WARNING:{NC} {message}")
+
+
+def info(message):
+    print(f"{GREEN}✓{NC} {message}")
+
+
+def copy_file(source, target):
+    """Copy source over target atomically, using copy_file_range where possible."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.sync-tmp")
+    copy_range = getattr(os, "copy_file_range", None)
+    try:
+        if copy_range is None:
+            raise OSError
+        with open(source, "rb") as src, open(tmp, "wb") as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = copy_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError:
+        shutil.copyfile(source, tmp)
+    shutil.copymode(source, tmp)
+    os.replace(tmp, target)
+
+
+def source_files():
+    """Map each source file to (sync?, scan?) from one walk of the patterns and dirs."""
+    files = {}
+    for pattern in SYNC_PATTERNS:
+        for path in REPO_ROOT.glob(pattern):
+            if path.is_file():
+                files[path.relative_to(REPO_ROOT).as_posix()] = [True, False]
+    for directory in DEV_PATH_DIRS:
+        for root, _, names in os.walk(REPO_ROOT / directory):
+            for name in names:
+                rel = (Path(root) / name).relative_to(REPO_ROOT).as_posix()
+                files.setdefault(rel, [False, False])[1] = True
+    return files
+
+
+def template_violations():
+    violations = []
+    claude_md = TEMPLATE_DIR / "CLAUDE.md"
+    if claude_md.exists() and b"[PROJECT_NAME]" not in claude_md.read_bytes():
+        violations.append("template/CLAUDE.md missing [PROJECT_NAME] placeholder")
+
+    unexpected = 0
+    for directory in USER_DATA_DIRS:
+        for _, _, names in os.walk(TEMPLATE_DIR / directory):
+            unexpected += sum(1 for name in names if name != ".gitkeep")
+    if unexpected:
+        violations.append(
+            f"Found {unexpected} unexpected files in template/.elimination/active or archive"
+        )
+    return violations
+
+
+def sync(dry_run=False, force=False):
+    """Run the single pass; return the change report."""
+    files = source_files()
+    sync_paths = sorted(p for p, (do_sync, _) in files.items() if do_sync)
+    cache = HashCache()
+    template_digests = cache.digests(TEMPLATE_DIR, sync_paths)
+    if not dry_run:
+        cache.save()
+
+    report = {"dry_run": dry_run, "synced": [], "unchanged": [], "violations": []}
+    dev_path_files = []
+    to_copy = []
+    for rel in sorted(files):
+        do_sync, scan = files[rel]
+        data = (REPO_ROOT / rel).read_bytes()
+        if scan and DEV_PATH_RE.search(data):
+            dev_path_files.append(rel)
+        if not do_sync:
+            continue
+        if hashlib.sha256(data).hexdigest() == template_digests.get(rel):
+            report["unchanged"].append(rel)
+        else:
+            to_copy.append(rel)
+
+    if dev_path_files:
+        report["violations"].append(
+            f"Found dev-specific paths in command/script files: {', '.join(dev_path_files)}"
+        )
+    report["violations"].extend(template_violations())
+
+    for violation in report["violations"]:
+        warn(violation)
+    if report["violations"] and not force:
+        return report
+
+    for rel in to_copy:
+        if dry_run:
+            print(f"[DRY-RUN] Would sync: {rel} -> template/{rel}")
+        else:
+            copy_file(REPO_ROOT / rel, TEMPLATE_DIR / rel)
+            info(f"Synced: {rel}")
+        report["synced"].append(rel)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync development files to template/")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be synced")
+    parser.add_argument("--force", action="store_true", help="Proceed despite violations")
+    parser.add_argument("--report", help="Write the JSON change report to this path")
+    args = parser.parse_args()
+
+    report = sync(dry_run=args.dry_run, force=args.force)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if report["violations"] and not args.force:
+        print("")
+        print(f"{RED}ERROR:{NC} Found {len(report['violations'])} violation(s). "
+              "Use --force to proceed anyway.", file=sys.stderr)
+        return 1
+    if report["violations"]:
+        warn(f"Proceeding with {len(report['violations'])} violation(s) due to --force")
+
+    print("")
+    info(f"Synced {len(report['synced'])} files ({len(report['unchanged'])} unchanged)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())